@@ -0,0 +1,145 @@
+"""페이지별 데이터 경로 벤치마크 (가짜 데이터로 규모별 응답 시간 측정)
+
+    python -m benchmarks.bench                                  # 1e3, 1e4 행
+    python -m benchmarks.bench --sizes 1000 100000 1000000 --out bench.json
+    python -m benchmarks.bench --baseline bench.json            # 기준보다 느려지면 종료 코드 1
+"""
+import os
+import sys
+import json
+import time
+import random
+import sqlite3
+import argparse
+import datetime
+import platform
+import tempfile
+import statistics
+
+from fridge.db import configure, init_db, get_query_cache
+from fridge.queries import (
+    get_dashboard_summary, get_expiry_items, get_inventory_page, get_point_balance, get_points_history,
+    get_waste_series, search_guide,
+)
+from fridge.recipes import recommend_recipes
+from benchmarks.synthetic import generate
+
+DEFAULT_SIZES = [1000, 10000]
+DEFAULT_OUT = "benchmarks/results.json"
+REPEAT = 5
+SLOWER_THRESHOLD = 1.5  # 기준보다 이 배수 이상 느려지면 회귀
+MIN_REGRESSION_MS = 1.0  # 이보다 짧은 측정값은 잡음으로 보고 비교하지 않음
+
+def scenarios(names, seed):
+    # 페이지별로 화면을 그릴 때 실제로 타는 데이터 경로
+    rng = random.Random(seed)
+    today = datetime.date.today()
+    fridge_sample = rng.sample(names, min(20, len(names)))
+    search_term = rng.choice(names)
+
+    return {
+        "inventory_page": lambda: get_inventory_page(),
+        "inventory_filtered": lambda: get_inventory_page(category="채소", name="상"),
+        "expiry_sort": lambda: get_expiry_items(limit=3),
+        "recipe_match_selected": lambda: recommend_recipes(fridge_sample),
+        "recipe_match_fridge": lambda: recommend_recipes(),
+        "dashboard": get_dashboard_summary,
+        "guide_search": lambda: search_guide(search_term),
+        "guide_search_short": lambda: search_guide("계란"),
+        "points_balance": get_point_balance,
+        "points_history": lambda: get_points_history(),
+        "waste_series_3y": lambda: get_waste_series(today - datetime.timedelta(days=3 * 365), today),
+    }
+
+def _summary(samples):
+    samples = sorted(samples)
+    return {
+        "median": round(statistics.median(samples), 3),
+        "p95": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+    }
+
+def measure(fn, repeat=REPEAT):
+    # cold: 조회 캐시를 비우고 DB 까지 다녀오는 시간 / warm: 캐시에서 바로 나오는 시간
+    cold = []
+    for _ in range(repeat):
+        get_query_cache().clear()
+        started = time.perf_counter()
+        fn()
+        cold.append((time.perf_counter() - started) * 1000)
+    warm = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        warm.append((time.perf_counter() - started) * 1000)
+    return {"cold_ms": _summary(cold), "warm_ms": _summary(warm)}
+
+def run_size(size, seed, repeat, workdir):
+    db_file = os.path.join(workdir, f"bench_{size}.db")
+    for suffix in ("", "-wal", "-shm"):
+        if os.path.exists(db_file + suffix):
+            os.remove(db_file + suffix)
+    configure(db_file)
+    init_db()
+
+    started = time.perf_counter()
+    names = generate(ingredients=size, waste=size, points=size, recipes=size, seed=seed)
+    generate_s = time.perf_counter() - started
+    print(f"[{size}] 데이터 생성 {generate_s:.1f}s")
+
+    ops = {}
+    for name, fn in scenarios(names, seed).items():
+        ops[name] = measure(fn, repeat)
+        print(f"[{size}] {name:24s} cold {ops[name]['cold_ms']['median']:9.3f} ms   warm {ops[name]['warm_ms']['median']:8.3f} ms")
+    return {"size": size, "generate_s": round(generate_s, 3), "db_file": db_file, "ops": ops}
+
+def compare(results, baseline):
+    # 같은 규모·같은 항목끼리 cold 중앙값 비교
+    base = {(r["size"], op): v for r in baseline["results"] for op, v in r["ops"].items()}
+    regressions = []
+    for r in results:
+        for op, v in r["ops"].items():
+            old = base.get((r["size"], op))
+            if old is None:
+                continue
+            now_ms, old_ms = v["cold_ms"]["median"], old["cold_ms"]["median"]
+            if now_ms > MIN_REGRESSION_MS and now_ms > old_ms * SLOWER_THRESHOLD:
+                regressions.append(f"{op} @ {r['size']}: {old_ms:.3f} ms → {now_ms:.3f} ms")
+    return regressions
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="페이지별 데이터 경로 벤치마크")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES, help="테이블별 행 수 (10^3 ~ 10^6)")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=REPEAT)
+    parser.add_argument("--out", default=DEFAULT_OUT, help="결과 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--workdir", default=tempfile.gettempdir(), help="벤치마크용 DB 파일을 만들 폴더")
+    args = parser.parse_args(argv)
+
+    results = [run_size(size, args.seed, args.repeat, args.workdir) for size in args.sizes]
+    report = {
+        "meta": {
+            "created_at": datetime.datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": results,
+    }
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    with open(args.out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"✅ 결과 저장: {args.out}")
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f))
+        for line in regressions:
+            print(f"❌ 느려짐: {line}")
+        return 1 if regressions else 0
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
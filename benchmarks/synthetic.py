@@ -0,0 +1,75 @@
+"""벤치마크용 가짜 데이터 생성기 (같은 seed 면 항상 같은 데이터)"""
+import random
+import datetime
+
+from fridge.db import transaction
+
+BATCH_SIZE = 50000
+BASE_FOODS = ["계란", "우유", "두부", "상추", "돼지고기", "사과", "치킨", "양파", "김치", "마요네즈", "당근", "감자"]
+CATEGORIES = ["채소", "과일", "단백질", "유제품", "배달음식", "기타"]
+STORAGE_TYPES = ["냉장", "냉동", "실온"]
+RULES = ["음식물쓰레기", "일반쓰레기", "종이팩(물로 헹굼)", "플라스틱(내용물 비우기)"]
+
+def food_names(count):
+    # "계란0", "우유1" ... 처럼 겹치지 않는 음식 이름
+    return [f"{BASE_FOODS[i % len(BASE_FOODS)]}{i}" for i in range(count)]
+
+def _batched(rows, size=BATCH_SIZE):
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def _insert(query, rows):
+    # 큰 데이터도 BATCH_SIZE 줄씩 한 트랜잭션으로
+    for batch in _batched(rows):
+        with transaction() as tx:
+            tx.executemany(query, batch)
+
+def generate(ingredients=1000, waste=1000, points=1000, recipes=1000, foods=None, seed=42):
+    # 현재 설정된 DB(fridge.db.configure 로 지정)에 데이터를 채움
+    rng = random.Random(seed)
+    today = datetime.date.today()
+    names = food_names(foods or max(100, min(ingredients, 5000)))
+
+    _insert(
+        "INSERT OR IGNORE INTO food_catalog (name, category, default_days, storage_type, storage_tip, disposal_rule) "
+        "VALUES (?, ?, ?, ?, ?, ?)",
+        ((name, rng.choice(CATEGORIES), rng.randint(1, 60), rng.choice(STORAGE_TYPES),
+          f"{name} 보관 팁: 밀폐 용기에 넣어 보관", rng.choice(RULES)) for name in names)
+    )
+    _insert(
+        "INSERT INTO ingredients (food_id, name, category, quantity, expiry_date) "
+        "SELECT id, name, category, ?, ? FROM food_catalog WHERE name = ?",
+        ((rng.randint(1, 10), (today + datetime.timedelta(days=rng.randint(-30, 60))).isoformat(), rng.choice(names))
+         for _ in range(ingredients))
+    )
+    _insert(
+        "INSERT INTO waste_log (waste_date, amount_g) VALUES (?, ?)",
+        (((today - datetime.timedelta(days=rng.randint(0, 3 * 365))).isoformat(), rng.randint(50, 1500))
+         for _ in range(waste))
+    )
+    start = datetime.datetime.now() - datetime.timedelta(days=3 * 365)
+    _insert(
+        "INSERT INTO user_points (action_date, description, points) VALUES (?, ?, ?)",
+        (((start + datetime.timedelta(seconds=i * (3 * 365 * 86400 // max(points, 1)))).strftime("%Y-%m-%d %H:%M:%S"),
+          rng.choice(["출석체크", "알뜰 사용", "분리배출"]), rng.choice([10, 20, 30, 40]))
+         for i in range(points))
+    )
+
+    recipe_rows = []
+    link_rows = []
+    for i in range(recipes):
+        ings = rng.sample(names, rng.randint(2, 6))
+        recipe_rows.append((f"레시피{i}", rng.choice(["한식", "간단요리", "다이어트"]), rng.randint(80, 900), len(ings)))
+        link_rows.extend((f"레시피{i}", ing) for ing in ings)
+    _insert("INSERT OR IGNORE INTO recipes (name, kind, calories, ingredient_count) VALUES (?, ?, ?, ?)", recipe_rows)
+    _insert(
+        "INSERT OR IGNORE INTO recipe_ingredients (recipe_id, ingredient) SELECT id, ? FROM recipes WHERE name = ?",
+        ((ing, name) for name, ing in link_rows)
+    )
+    return names
@@ -0,0 +1,7 @@
+"""냉장고를 지켜줘 - 데이터 접근 계층 (Streamlit 없이 import 가능)
+
+배치 작업, 벤치마크, CLI 에서도 앱과 같은 쿼리/캐시/트랜잭션을 그대로 씁니다.
+
+    from fridge.db import init_db, get_data, transaction
+    from fridge import queries
+"""
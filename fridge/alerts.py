@@ -0,0 +1,143 @@
+"""소비기한 알림 큐 (프로세스당 하나의 백그라운드 스케줄러)
+
+재료마다 알림이 울릴 날짜(임박: 소비기한 - EXPIRY_ALERT_DAYS, 만료: 소비기한 다음 날)를
+최소 힙에 넣어 두고, 주기마다 오늘 날짜를 넘긴 것만 꺼내 expiry_alerts 에 추가함.
+화면은 안 본 알림만 읽으므로 재고가 많거나 페이지를 자주 열어도 비용이 늘지 않음.
+"""
+import json
+import heapq
+import datetime
+import threading
+
+from fridge.db import _process_singleton, _existing_singleton, current_household, set_household, get_connection, get_data, transaction
+from fridge.archive import archive_expired
+from fridge.queries import EXPIRY_ALERT_DAYS
+
+TICK_SECONDS = 60  # 몇 초마다 기준일을 넘은 재료를 확인할지
+
+class AlertScheduler:
+    # - 처음(그리고 날짜가 바뀔 때) 재고 전체로 힙을 만들고, 그 뒤로는 새로 추가된 id 만 읽음
+    # - 힙 맨 앞(가장 이른 기준일)만 보면 되므로 한 번 확인하는 비용은 울린 알림 수에 비례
+    def __init__(self, alert_days=EXPIRY_ALERT_DAYS, interval=TICK_SECONDS):
+        self.alert_days = alert_days
+        self.interval = interval
+        self._heap = []      # (기준일, 종류, 재료 id, 이름, 소비기한)
+        self._last_id = 0    # 힙에 넣은 마지막 재료 id (AUTOINCREMENT 라 재사용되지 않음)
+        self._loaded_on = None
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopped = False
+        self._thread = None
+        self.household = current_household()  # 스레드에서도 만든 가구의 DB 를 쓰도록
+
+    def _push(self, ingredient_id, name, expiry_date):
+        try:
+            expiry = datetime.date.fromisoformat(expiry_date)
+        except (TypeError, ValueError):
+            return  # 소비기한이 없거나 날짜가 아니면 알림 대상 아님
+        heapq.heappush(self._heap, (expiry - datetime.timedelta(days=self.alert_days), '임박', ingredient_id, name, expiry_date))
+        heapq.heappush(self._heap, (expiry + datetime.timedelta(days=1), '만료', ingredient_id, name, expiry_date))
+
+    def _scan_new(self, conn):
+        rows = conn.execute(
+            "SELECT id, name, expiry_date FROM ingredients WHERE id > ? ORDER BY id", (self._last_id,)
+        ).fetchall()
+        for ingredient_id, name, expiry_date in rows:
+            self._push(ingredient_id, name, expiry_date)
+        if rows:
+            self._last_id = rows[-1][0]
+
+    def tick(self, today=None):
+        # 기준일을 넘긴 알림을 큐에 추가하고, 새로 추가한 개수를 반환
+        today = today or datetime.date.today()
+        with self._lock:
+            if self._loaded_on != today:
+                # 하루 한 번: 오래 지난 재료를 이력으로 옮기고, 남은 재고 전체로 힙을 다시 만듦
+                # (소비기한을 앞당긴 재료도 다음 날에는 반영)
+                archive_expired()
+                self._heap, self._last_id, self._loaded_on = [], 0, today
+            with get_connection() as conn:
+                self._scan_new(conn)
+                due = []
+                while self._heap and self._heap[0][0] <= today:
+                    due.append(heapq.heappop(self._heap))
+                if not due:
+                    return 0
+                ids = json.dumps(sorted({item[2] for item in due}))
+                current = dict(conn.execute(
+                    "SELECT id, expiry_date FROM ingredients WHERE id IN (SELECT value FROM json_each(?))", (ids,)
+                ).fetchall())
+
+            rows = []
+            for _, kind, ingredient_id, name, expiry_date in due:
+                if ingredient_id not in current:
+                    continue  # 그 사이 먹었거나 버린 재료
+                if current[ingredient_id] != expiry_date:
+                    self._push(ingredient_id, name, current[ingredient_id])  # 바뀐 소비기한으로 다시 예약
+                    continue
+                if kind == '임박' and today > datetime.date.fromisoformat(expiry_date):
+                    continue  # 이미 지난 재료는 만료 알림만
+                rows.append((ingredient_id, kind, name, expiry_date))
+            if not rows:
+                return 0
+            with transaction() as tx:
+                # 하루 한 번 다시 읽을 때 이미 있는 알림은 그대로 둠 (봄 여부 유지)
+                cur = tx.executemany(
+                    "INSERT OR IGNORE INTO expiry_alerts (ingredient_id, kind, name, expiry_date) VALUES (?, ?, ?, ?)",
+                    rows
+                )
+            return cur.rowcount
+
+    def _run(self):
+        set_household(self.household)
+        while not self._stopped:
+            try:
+                self.tick()
+            except Exception as e:
+                print(f"❌ 소비기한 알림 오류: {e}")
+            self._wake.wait(self.interval)
+            self._wake.clear()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="fridge-expiry-alerts", daemon=True)
+        self._thread.start()
+        return self
+
+    def wake(self):
+        # 다음 주기를 기다리지 않고 바로 확인 (재료를 추가한 직후 등)
+        self._wake.set()
+
+    def close(self):
+        self._stopped = True
+        self._wake.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+def get_scheduler():
+    # 프로세스당 한 번만 시작됨 (init_db 이후에 호출)
+    return _process_singleton("alert_scheduler", lambda: AlertScheduler().start())
+
+def wake_scheduler():
+    # 쓰기가 커밋된 뒤 호출 → 임박 재료를 다음 주기까지 기다리지 않고 바로 확인
+    # 스케줄러를 띄우지 않은 곳(CLI, 벤치마크)에서는 아무것도 안 함
+    scheduler = _existing_singleton("alert_scheduler")
+    if scheduler is not None:
+        scheduler.wake()
+
+def count_new_alerts():
+    # 안 본 알림 개수 (seen = 0 부분 인덱스만 읽음)
+    return int(get_data("SELECT count(*) AS n FROM expiry_alerts WHERE seen = 0").iloc[0]['n'])
+
+def get_new_alerts():
+    return get_data(
+        "SELECT ingredient_id, kind, name, expiry_date FROM expiry_alerts "
+        "WHERE seen = 0 ORDER BY expiry_date, ingredient_id"
+    )
+
+def mark_alerts_seen(tx, alerts):
+    # 화면에 보여 준 (ingredient_id, kind) 만 "봄" 처리
+    # 읽은 뒤 커밋 전에 스케줄러가 새로 넣은 알림은 그대로 남아 다음에 보임
+    tx.executemany(
+        "UPDATE expiry_alerts SET seen = 1 WHERE ingredient_id = ? AND kind = ? AND seen = 0",
+        [(int(ingredient_id), kind) for ingredient_id, kind in alerts]
+    )
@@ -0,0 +1,48 @@
+"""오래 지난 재료를 재고에서 이력 테이블(ingredient_history)로 옮기는 정리 작업
+
+소비기한 알림 스케줄러가 하루에 한 번 실행하고, 따로 돌릴 수도 있음:
+
+    python -m fridge.archive              # 소비기한이 ARCHIVE_AFTER_DAYS 일 넘게 지난 재료 정리
+    python -m fridge.archive --days 0     # 지난 재료는 모두
+"""
+import sys
+import argparse
+import datetime
+
+from fridge.db import DB_FILE, configure, init_db, get_connection, transaction
+from fridge.queries import archive_ingredients
+
+ARCHIVE_AFTER_DAYS = 14    # 소비기한이 이만큼 지나도록 아무도 처리하지 않으면 이력으로 옮김
+ARCHIVE_BATCH_SIZE = 500   # 한 트랜잭션에서 옮길 최대 행 수 (쓰기 락을 오래 잡지 않도록)
+
+def archive_expired(days=ARCHIVE_AFTER_DAYS, batch_size=ARCHIVE_BATCH_SIZE):
+    # 소비기한 인덱스 앞쪽부터 batch_size 개씩 옮기고 커밋, 옮긴 행 수를 반환
+    cutoff = (datetime.date.today() - datetime.timedelta(days=days)).isoformat()
+    moved = 0
+    while True:
+        with get_connection() as conn:
+            ids = [row[0] for row in conn.execute(
+                "SELECT id FROM ingredients WHERE expiry_date < ? ORDER BY expiry_date LIMIT ?", (cutoff, batch_size)
+            )]
+        if not ids:
+            return moved
+        with transaction() as tx:
+            archive_ingredients(tx, ids, "expired")
+        moved += len(ids)
+        if len(ids) < batch_size:
+            return moved
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="오래 지난 재료를 이력 테이블로 옮깁니다.")
+    parser.add_argument("--db", default=DB_FILE, help="대상 DB 파일 (기본: %(default)s)")
+    parser.add_argument("--days", type=int, default=ARCHIVE_AFTER_DAYS, help="소비기한이 며칠 지난 재료부터 옮길지")
+    parser.add_argument("--batch-size", type=int, default=ARCHIVE_BATCH_SIZE)
+    args = parser.parse_args(argv)
+
+    configure(args.db)
+    init_db()
+    print(f"✅ {archive_expired(args.days, args.batch_size)}개를 이력으로 옮겼습니다.")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,60 @@
+"""세션 안에서 계속 행을 추가하는 표 (project.py 의 session_state 저장소)
+
+pd.concat 으로 매번 전체 DataFrame 을 복사하는 대신 열마다 리스트에 추가만 하고
+(리스트는 여유 공간을 두고 늘어나서 추가 한 번이 평균 O(1)),
+화면에 그릴 때만 DataFrame 을 만듦. 아직 DB 에 안 들어간 행은 모아서 한 트랜잭션으로 저장.
+"""
+from fridge.db import transaction
+
+class ColumnBuffer:
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self._data = {c: [] for c in self.columns}
+        self._frame = None   # 마지막으로 만든 DataFrame (다음 추가 전까지 재사용)
+        self._flushed = 0    # 앞에서부터 몇 행이 DB 에 저장됐는지
+
+    @classmethod
+    def from_columns(cls, data):
+        # {열 이름: 값 목록} 으로 시작 데이터 채우기
+        buf = cls(data)
+        for c, values in data.items():
+            buf._data[c].extend(values)
+        return buf
+
+    def __len__(self):
+        return len(self._data[self.columns[0]]) if self.columns else 0
+
+    def append(self, row):
+        # row: {열 이름: 값}
+        for c in self.columns:
+            self._data[c].append(row[c])
+        self._frame = None
+
+    def column(self, name):
+        # 열 하나를 리스트로 (DataFrame 을 만들지 않고 개수/중복 제거 등을 계산할 때, 읽기 전용)
+        return self._data[name]
+
+    def to_frame(self):
+        # 그릴 때만 DataFrame 생성, 추가가 없으면 같은 객체를 돌려줌 (수정하려면 .copy())
+        if self._frame is None:
+            import pandas as pd  # import 시간을 줄이려고 처음 그릴 때 로드
+            self._frame = pd.DataFrame(self._data, columns=self.columns)
+        return self._frame
+
+    def pending(self):
+        # 아직 DB 에 저장하지 않은 행들 (열 순서대로 튜플)
+        return list(zip(*(self._data[c][self._flushed:] for c in self.columns)))
+
+    def mark_flushed(self):
+        # 지금까지의 행은 저장할 필요 없음 (샘플 데이터 등)
+        self._flushed = len(self)
+
+    def flush(self, write):
+        # write(tx, rows) 로 대기 중인 행을 한 트랜잭션에 저장하고, 저장한 행 수를 반환
+        rows = self.pending()
+        if not rows:
+            return 0
+        with transaction() as tx:
+            write(tx, rows)
+        self._flushed += len(rows)
+        return len(rows)
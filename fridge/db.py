@@ -0,0 +1,398 @@
+"""DB 연결 풀, 트랜잭션, 조회 캐시 (Streamlit 없이 import 가능)"""
+import os
+import re
+import time
+import queue
+import sqlite3
+import threading
+import contextlib
+import contextvars
+from collections import OrderedDict
+
+from fridge import profiler
+from fridge.schema import migrate
+
+# ==========================================
+# 1. DB 연결
+# ==========================================
+DB_FILE = os.environ.get('FRIDGE_DB', 'fridge.db')  # 환경변수로 다른 DB 파일 지정 가능
+# 시드 CSV 는 실행 위치(cwd)와 상관없이 저장소 루트의 파일을 사용 (벤치마크를 어디서 돌려도 같은 데이터)
+SEED_CSV = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'food_data.csv')
+HOUSEHOLD_DIR = os.environ.get('FRIDGE_HOUSEHOLD_DIR', 'households')  # 가구별 DB 파일을 두는 폴더
+MAX_OPEN_HOUSEHOLDS = 64  # 풀/캐시를 열어 둘 최대 가구 수 (넘으면 가장 오래 안 쓴 가구부터 닫음)
+HOUSEHOLD_PATTERN = re.compile(r"[A-Za-z0-9_-]{1,64}")
+POOL_SIZE = 4  # 놀고 있는 커넥션을 최대 몇 개까지 보관할지
+
+class ConnectionPool:
+    # 세션(스레드)마다 커넥션을 빌려 쓰고 돌려놓는 작은 풀
+    # - 한 커넥션은 동시에 한 스레드만 사용 (커서 상태가 섞이지 않음)
+    # - WAL 모드라 읽기(get_data)는 쓰기가 진행 중이어도 막히지 않음
+    # - 쓰기는 write_lock 으로 프로세스 안에서 한 줄로 세워서 "database is locked" 대기를 없앰
+    # - 쓰기는 항상 전용 커넥션 하나로만 함 → 그 커넥션의 data_version 이 바뀌었다면 다른 프로세스가 쓴 것
+    def __init__(self, path, size=POOL_SIZE):
+        self.path = path
+        self.write_lock = threading.Lock()
+        self._idle = queue.LifoQueue(maxsize=size)
+        self._writer = None
+        self._data_version = None
+
+    def _connect(self):
+        # check_same_thread=False: 풀을 통해 다른 스레드로 넘겨 쓰기 때문에 필요 (동시 사용은 안 함)
+        conn = sqlite3.connect(self.path, check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")  # WAL 에서는 체크포인트 때만 fsync
+        conn.execute("PRAGMA busy_timeout=5000")   # 다른 프로세스가 쓰는 중이면 최대 5초 대기
+        return conn
+
+    @contextlib.contextmanager
+    def connection(self, write=False):
+        if write:
+            with self.write_lock:
+                conn = self._writer_connection()
+                try:
+                    yield conn
+                finally:
+                    if conn.in_transaction:
+                        conn.rollback()
+            return
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = self._connect()
+        try:
+            yield conn
+        finally:
+            # 중간에 에러가 나서 열린 트랜잭션이 남았으면 되돌리고 반납
+            if conn.in_transaction:
+                conn.rollback()
+            try:
+                self._idle.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+
+    def _writer_connection(self):
+        # write_lock 을 잡은 상태에서만 호출
+        if self._writer is None:
+            self._writer = self._connect()
+        return self._writer
+
+    def changed_elsewhere(self):
+        # 마지막으로 확인한 뒤 다른 프로세스(importer/archive CLI 등)가 커밋했으면 True
+        # PRAGMA data_version 은 "다른" 커넥션이 커밋했을 때만 바뀌므로 쓰기 전용 커넥션에서 읽음
+        # 이 프로세스에서 쓰는 중이면(락이 잡혀 있으면) 기다리지 않고 다음 조회 때 확인
+        if not self.write_lock.acquire(blocking=False):
+            return False
+        try:
+            version = self._writer_connection().execute("PRAGMA data_version").fetchone()[0]
+            changed = self._data_version is not None and version != self._data_version
+            self._data_version = version
+            return changed
+        finally:
+            self.write_lock.release()
+
+    def close(self):
+        # 커넥션을 모두 닫음 (configure 로 DB 파일을 바꿀 때 사용)
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
+        with self.write_lock:
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+            self._data_version = None
+
+# ------------------------------------------
+# 가구(household)별 분리: 가구마다 DB 파일 하나 (fridge.db 는 가구를 고르지 않았을 때 쓰는 기본 파일)
+# 스키마/트리거/요약 테이블은 그대로이고, 쿼리는 항상 자기 가구 파일만 읽고 씀
+# ------------------------------------------
+_household = contextvars.ContextVar("fridge_household", default=None)
+
+def set_household(household):
+    # 지금 실행 중인 rerun(또는 스레드)이 쓸 가구 지정 (None 이면 기본 DB)
+    if household is not None and not HOUSEHOLD_PATTERN.fullmatch(household):
+        raise ValueError(f"가구 코드는 영문/숫자/-/_ 1~64자만 쓸 수 있습니다: {household!r}")
+    _household.set(household)
+    if household is not None:
+        _touch_household(household)
+
+def current_household():
+    return _household.get()
+
+def current_db_file():
+    household = _household.get()
+    if household is None:
+        return DB_FILE
+    os.makedirs(HOUSEHOLD_DIR, exist_ok=True)
+    return os.path.join(HOUSEHOLD_DIR, f"{household}.db")
+
+# 프로세스 전체에서 (가구마다) 하나만 쓰는 객체들 (Streamlit 의 st.cache_resource 와 같은 역할)
+# init_db 처럼 만드는 도중에 다른 객체(get_pool)를 부를 수 있어서 RLock 사용
+_shared = {}                      # (가구, 이름) -> 객체
+_open_households = OrderedDict()  # 최근에 쓴 가구 순서 (LRU)
+_shared_lock = threading.RLock()
+
+def _process_singleton(name, factory):
+    key = (_household.get(), name)
+    obj = _shared.get(key)
+    if obj is None:
+        with _shared_lock:
+            obj = _shared.get(key)
+            if obj is None:
+                obj = _shared[key] = factory()
+    return obj
+
+def _existing_singleton(name):
+    # 이미 만들어진 객체만 반환 (없으면 만들지 않고 None)
+    return _shared.get((_household.get(), name))
+
+def _close_all(objects):
+    # close() 가 있는 객체는 나중에 만든 것부터 닫음 → 스케줄러/쓰기 스레드가 멈춘 뒤 풀을 닫음
+    for obj in reversed(objects):
+        close = getattr(obj, "close", None)
+        if close is not None:
+            close()
+
+def _busy(household):
+    # 아직 저장 안 된 쓰기가 큐에 있는 가구 (busy() 가 있는 객체 기준)
+    for (owner, _), obj in list(_shared.items()):
+        busy = getattr(obj, "busy", None)
+        if owner == household and busy is not None and busy():
+            return True
+    return False
+
+def _touch_household(household):
+    # 오래 안 쓴 가구부터 닫되, 쓰기가 밀려 있는 가구는 건너뜀 (다음에 다시 시도)
+    with _shared_lock:
+        _open_households[household] = True
+        _open_households.move_to_end(household)
+        evicted = []
+        for old in list(_open_households):
+            if len(_open_households) <= MAX_OPEN_HOUSEHOLDS:
+                break
+            if old != household and not _busy(old):
+                del _open_households[old]
+                evicted.append(old)
+    # 닫는 일(스레드 join 등)은 지금 요청과 상관없는 가구의 일이므로 별도 스레드에서
+    if evicted:
+        threading.Thread(target=_close_households, args=(evicted,), name="fridge-evict", daemon=True).start()
+
+def _close_households(households):
+    for old in households:
+        _close_household(old)
+
+def _close_household(household):
+    # 먼저 _shared 에서 빼서 이후 요청은 (닫히는 중인 객체 대신) 새 객체를 만들게 하고, 닫는 건 락 밖에서
+    # 멈추는 중인 쓰기 스레드는 자기 풀을 들고 있으므로 남은 쓰기를 그대로 저장할 수 있음
+    with _shared_lock:
+        owned = [key for key in _shared if key[0] == household]
+        objects = [_shared.pop(key) for key in owned]
+    _close_all(objects)
+
+def get_pool():
+    return _process_singleton("pool", lambda: ConnectionPool(current_db_file()))
+
+def configure(db_file):
+    # 다른 DB 파일로 전환 (벤치마크, 배치 작업, 테스트용)
+    # 기존 풀/캐시/초기화 상태는 (모든 가구 것까지) 버리고, 다음 호출부터 새 파일 기준으로 다시 만듦
+    global DB_FILE
+    with _shared_lock:
+        _close_all(list(_shared.values()))
+        _shared.clear()
+        _open_households.clear()
+        DB_FILE = db_file
+
+def get_connection(write=False):
+    # 사용법: with get_connection() as conn: ...  (쓰기는 write=True)
+    return get_pool().connection(write=write)
+
+# ------------------------------------------
+# 조회 결과 캐시 (쓰기가 있을 때만 무효화)
+# ------------------------------------------
+CACHE_SIZE = 256  # 보관할 쿼리 결과 최대 개수 (LRU)
+TABLE_PATTERN = re.compile(r"\b(?:FROM|JOIN|INTO|UPDATE)\s+([A-Za-z_]\w*)", re.IGNORECASE)
+
+def tables_in(query):
+    # 쿼리가 건드리는 테이블 이름들 (캐시 무효화 단위)
+    return frozenset(name.lower() for name in TABLE_PATTERN.findall(query))
+
+# 트리거 때문에 같이 바뀌는 테이블 (여기에 쓰면 오른쪽 테이블 캐시도 무효화)
+TRIGGER_TABLES = {
+    "ingredients": {"dashboard_summary", "expiry_calendar", "expiry_alerts"},
+    "food_catalog": {"food_catalog_fts"},
+    "waste_log": {"dashboard_summary", "waste_rollup"},
+    "user_points": {"dashboard_summary"},
+}
+
+def written_tables(query):
+    tables = set(tables_in(query))
+    for t in list(tables):
+        tables |= TRIGGER_TABLES.get(t, set())
+    return tables
+
+class QueryCache:
+    # (쿼리, 파라미터) -> 결과 DataFrame
+    # 테이블마다 버전 번호를 두고, 쓰기가 커밋되면 그 테이블 버전을 올림
+    # 저장할 때의 버전과 지금 버전이 다르면 그 결과는 버림 → 정확히 바뀐 테이블만 다시 조회
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._versions = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def _current(self, tables):
+        return (self._generation,) + tuple(self._versions.get(t, 0) for t in sorted(tables))
+
+    def versions(self, tables):
+        with self._lock:
+            return self._current(tables)
+
+    def get(self, key, tables):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            versions, df = entry
+            if versions != self._current(tables):
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return df
+
+    def put(self, key, versions, df):
+        with self._lock:
+            self._entries[key] = (versions, df)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, tables):
+        with self._lock:
+            for t in tables:
+                self._versions[t] = self._versions.get(t, 0) + 1
+
+    def invalidate_all(self):
+        # 어느 테이블이 바뀌었는지 모를 때(다른 프로세스의 쓰기) 전부 무효화
+        # 세대 번호도 올려서, 지금 조회 중인 결과가 옛 버전으로 다시 저장되는 것도 막음
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+
+    def clear(self):
+        # 저장된 결과 전부 버림 (벤치마크에서 캐시 없이 잴 때 사용)
+        with self._lock:
+            self._entries.clear()
+
+def get_query_cache():
+    return _process_singleton("query_cache", QueryCache)
+
+class Transaction:
+    # transaction() 안에서 쓰는 커넥션 래퍼 (어떤 테이블에 썼는지 기록)
+    def __init__(self, conn):
+        self.conn = conn
+        self.tables = set()
+
+    def execute(self, query, params=()):
+        self.tables |= written_tables(query)
+        started = time.perf_counter()
+        cur = self.conn.execute(query, params)
+        profiler.record("write", query, params, cur.rowcount, started)
+        return cur
+
+    def executemany(self, query, rows):
+        self.tables |= written_tables(query)
+        started = time.perf_counter()
+        cur = self.conn.executemany(query, rows)
+        profiler.record("write_many", query, None, cur.rowcount, started)
+        return cur
+
+@contextlib.contextmanager
+def transaction(pool=None):
+    # 여러 쓰기를 커밋 한 번(=fsync 한 번)으로 묶는 작업 단위
+    #   with transaction() as tx:
+    #       tx.execute(...)
+    #       tx.executemany(...)
+    # 블록이 정상 종료되면 커밋, 예외가 나면 전부 롤백 (중간 상태가 남지 않음)
+    # pool: 지금 가구의 풀 대신 쓸 풀 (쓰기 스레드가 만들 때 받아 둔 풀로 끝까지 저장할 때)
+    with (pool or get_pool()).connection(write=True) as conn:
+        tx = Transaction(conn)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield tx
+        except BaseException:
+            conn.rollback()
+            raise
+        started = time.perf_counter()
+        conn.commit()
+        profiler.record("commit", "COMMIT", None, None, started)
+    # 커밋이 끝난 뒤에 캐시 무효화 (커밋 전에 올리면 옛 데이터가 새 버전으로 캐시될 수 있음)
+    get_query_cache().invalidate(tx.tables)
+
+# ==========================================
+# 2. 초기화 (스키마 마이그레이션 + 기본 데이터)
+# ==========================================
+def init_db():
+    # 프로세스당 한 번만 실행됨 (위젯 클릭마다 다시 불려도 바로 반환)
+    _process_singleton("init_db", _init_db)
+
+def _init_db():
+    with get_connection(write=True) as conn:
+        migrate(conn)
+        # CSV 기준 정보(권장 보관일수 등)가 아직 카탈로그에 안 들어왔는지
+        needs_catalog = conn.execute("SELECT 1 FROM food_catalog WHERE default_days IS NOT NULL LIMIT 1").fetchone() is None
+        is_empty = conn.execute("SELECT 1 FROM ingredients LIMIT 1").fetchone() is None
+    
+    # ------------------------------------------
+    # 🌟 CSV 데이터 자동 로드 (카탈로그는 처음 한 번, 냉장고는 비었을 때만)
+    # ------------------------------------------
+    # 샘플 재고는 기본 DB 에만 (새 가구는 카탈로그만 받고 빈 냉장고로 시작)
+    stock = is_empty and _household.get() is None
+    if needs_catalog or stock:
+        if os.path.exists(SEED_CSV):
+            from fridge.importer import import_food_csv  # pandas 는 필요할 때만 로드
+            try:
+                import_food_csv(SEED_CSV, stock=stock)
+            except Exception as e:
+                print(f"❌ CSV 로드 오류: {e}")
+    return True
+
+# ==========================================
+# 3. 쿼리 실행
+# ==========================================
+def run_query(query, params=()):
+    # 단일 쓰기 (여러 문장을 묶을 때는 transaction() 사용)
+    with transaction() as tx:
+        tx.execute(query, params)
+
+def run_many(query, rows):
+    # 같은 문장을 여러 행에 대해 한 번의 커밋으로 실행
+    with transaction() as tx:
+        tx.executemany(query, rows)
+
+def explain(query, params=()):
+    # 쿼리 실행 계획 (느린 쿼리 진단용)
+    with get_connection() as conn:
+        rows = conn.execute("EXPLAIN QUERY PLAN " + query, params).fetchall()
+    return "\n".join(row[-1] for row in rows)
+
+def get_data(query, params=()):
+    # 같은 (쿼리, 파라미터)는 관련 테이블에 쓰기가 없었다면 메모리에서 바로 반환
+    started = time.perf_counter()
+    cache = get_query_cache()
+    if get_pool().changed_elsewhere():
+        cache.invalidate_all()
+    key = (query, tuple(params))
+    tables = tables_in(query)
+    df = cache.get(key, tables)
+    cached = df is not None
+    if not cached:
+        versions = cache.versions(tables)  # 조회 "전" 버전으로 저장해야 도중의 쓰기를 놓치지 않음
+        import pandas as pd  # import 시간을 줄이려고 처음 조회할 때 로드
+        with get_connection() as conn:
+            df = pd.read_sql(query, conn, params=params)
+        cache.put(key, versions, df)
+    profiler.record("read", query, params, len(df), started, cached=cached,
+                    explain=lambda: explain(query, params))
+    return df.copy()  # 호출한 쪽에서 컬럼을 추가/수정해도 캐시 원본은 그대로
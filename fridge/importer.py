@@ -0,0 +1,79 @@
+"""음식 CSV / 레시피 CSV 가져오기 (대용량도 청크 단위로 스트리밍)
+
+    python -m fridge.importer food_data.csv            # food_catalog 에 upsert
+    python -m fridge.importer food_data.csv --stock    # + 재고가 없는 음식은 냉장고에도 1개씩
+    python -m fridge.importer recipes.csv --recipes    # 레시피 카탈로그
+"""
+import sys
+import time
+import argparse
+import datetime
+
+import pandas as pd
+
+from fridge.db import DB_FILE, configure, init_db, transaction
+
+IMPORT_CHUNK_SIZE = 10000
+CATALOG_COLUMNS = ['name', 'category', 'default_days', 'storage_type', 'storage_tip', 'disposal_rule']
+
+def import_food_csv(csv_file, chunksize=IMPORT_CHUNK_SIZE, stock=False):
+    # CSV 를 chunksize 줄씩 읽어서 food_catalog 에 이름 기준 upsert (청크마다 커밋 한 번)
+    # - 여러 번 돌려도 중복이 생기지 않음 (같은 이름이면 최신 값으로 덮어씀)
+    # - stock=True 면 아직 재고가 없는 음식을 "오늘 + 권장일수" 유통기한으로 1개씩 채움
+    # 반환값: {"rows": 처리한 줄 수, "seconds": 걸린 시간, "rows_per_sec": 초당 처리량}
+    started = time.perf_counter()
+    today = pd.Timestamp(datetime.date.today())
+    rows = 0
+    for chunk in pd.read_csv(csv_file, chunksize=chunksize):
+        chunk = chunk.reindex(columns=CATALOG_COLUMNS)  # CSV 에 없는 컬럼은 빈 값
+        chunk = chunk[chunk['name'].notna()]
+        catalog_rows = chunk.astype(object).where(chunk.notna(), None)
+        
+        with transaction() as tx:
+            tx.executemany(
+                "INSERT INTO food_catalog (name, category, default_days, storage_type, storage_tip, disposal_rule) "
+                "VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET category = excluded.category, default_days = excluded.default_days, "
+                "storage_type = excluded.storage_type, storage_tip = excluded.storage_tip, "
+                "disposal_rule = excluded.disposal_rule",
+                catalog_rows.itertuples(index=False, name=None)
+            )
+            if stock:
+                # 유통기한 계산 (오늘 + 권장일수) - 행마다 lambda 대신 컬럼 단위로 한 번에
+                expiry = (today + pd.to_timedelta(chunk['default_days'], unit='D')).dt.strftime('%Y-%m-%d')
+                expiry = expiry.astype(object).where(expiry.notna(), None)
+                tx.executemany(
+                    "INSERT INTO ingredients (food_id, name, category, quantity, expiry_date) "
+                    "SELECT c.id, c.name, c.category, 1, ? FROM food_catalog c WHERE c.name = ? "
+                    "AND NOT EXISTS (SELECT 1 FROM ingredients i WHERE i.food_id = c.id)",
+                    zip(expiry, chunk['name'])
+                )
+        rows += len(chunk)
+    
+    seconds = time.perf_counter() - started
+    stats = {"rows": rows, "seconds": round(seconds, 3), "rows_per_sec": round(rows / seconds) if seconds else rows}
+    print(f"✅ {csv_file}: {rows}줄 가져옴 ({stats['rows_per_sec']} rows/s)")
+    return stats
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="CSV 를 fridge.db 로 가져옵니다.")
+    parser.add_argument("csv_file")
+    parser.add_argument("--db", default=DB_FILE, help="대상 DB 파일 (기본: %(default)s)")
+    parser.add_argument("--chunksize", type=int, default=IMPORT_CHUNK_SIZE)
+    parser.add_argument("--stock", action="store_true", help="재고가 없는 음식을 냉장고에도 추가")
+    parser.add_argument("--recipes", action="store_true", help="레시피 CSV(레시피, 필요재료, 유형, 칼로리)로 취급")
+    args = parser.parse_args(argv)
+
+    configure(args.db)
+    init_db()
+    if args.recipes:
+        from fridge.recipes import load_recipes
+        started = time.perf_counter()
+        rows = load_recipes(args.csv_file, chunksize=args.chunksize)
+        print(f"✅ {args.csv_file}: 레시피 {rows}개 ({rows / (time.perf_counter() - started):.0f} rows/s)")
+    else:
+        import_food_csv(args.csv_file, chunksize=args.chunksize, stock=args.stock)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""쿼리/페이지 실행 시간 기록 (켜져 있을 때만 동작)
+
+    FRIDGE_PROFILE=1             모든 rerun 기록
+    FRIDGE_PROFILE_ALLOW_DEBUG=1 앱에서 ?debug=1 로 세션별로 켜는 것을 허용 (기본: 허용 안 함)
+    FRIDGE_PROFILE_LOG=파일경로    rerun 마다 JSON 한 줄씩 추가 (기본: profile.jsonl)
+    FRIDGE_PROFILE_LOG_MB=10     로그가 이 크기를 넘으면 파일경로.1 로 옮기고 새로 씀 (이전 .1 은 삭제)
+    FRIDGE_SLOW_MS=100           이보다 느린 조회는 EXPLAIN QUERY PLAN 을 같이 기록
+"""
+import os
+import re
+import json
+import time
+import datetime
+import threading
+import contextlib
+import contextvars
+
+PROFILE_LOG = os.environ.get("FRIDGE_PROFILE_LOG", "profile.jsonl")
+PROFILE_LOG_MAX_BYTES = int(float(os.environ.get("FRIDGE_PROFILE_LOG_MB", "10")) * 1024 * 1024)
+SLOW_QUERY_MS = float(os.environ.get("FRIDGE_SLOW_MS", "100"))
+
+_log_lock = threading.Lock()
+
+_current = contextvars.ContextVar("fridge_profile_run", default=None)
+
+def enabled():
+    return os.environ.get("FRIDGE_PROFILE", "") not in ("", "0")
+
+def debug_allowed():
+    # 주소의 ?debug=1 은 SQL 이 그대로 보이므로 운영자가 환경변수로 허용했을 때만 통함
+    return os.environ.get("FRIDGE_PROFILE_ALLOW_DEBUG", "") not in ("", "0")
+
+class Span:
+    # 페이지(메뉴 분기) 같은 구간 하나의 실행 시간
+    def __init__(self, run, name):
+        self.run = run
+        self.name = name
+        self.started = time.perf_counter()
+        self.ms = None
+
+    def end(self):
+        if self.ms is None:
+            self.ms = (time.perf_counter() - self.started) * 1000
+            if self.run is not None:
+                self.run.spans.append({"name": self.name, "ms": round(self.ms, 3)})
+        return self.ms
+
+class Run:
+    # rerun 한 번 동안 실행된 쿼리와 구간 기록
+    def __init__(self, label):
+        self.label = label
+        self.started_at = datetime.datetime.now().isoformat(timespec="seconds")
+        self.started = time.perf_counter()
+        self.queries = []
+        self.spans = []
+        self.total_ms = None
+
+    @property
+    def slow_queries(self):
+        return [q for q in self.queries if q["slow"]]
+
+    def to_dict(self):
+        return {
+            "label": self.label,
+            "started_at": self.started_at,
+            "total_ms": self.total_ms,
+            "query_ms": round(sum(q["ms"] for q in self.queries), 3),
+            "queries": self.queries,
+            "spans": self.spans,
+        }
+
+def start_run(label=""):
+    run = Run(label)
+    _current.set(run)
+    return run
+
+def finish_run(run, log_path=PROFILE_LOG):
+    # rerun 이 끝날 때 호출 → 전체 시간 확정 + JSON lines 로 추가 기록
+    run.total_ms = round((time.perf_counter() - run.started) * 1000, 3)
+    _current.set(None)
+    if log_path:
+        line = json.dumps(run.to_dict(), ensure_ascii=False) + "\n"
+        with _log_lock:
+            _rotate(log_path)
+            with open(log_path, "a", encoding="utf-8") as f:
+                f.write(line)
+    return run
+
+def _rotate(log_path):
+    # 로그가 계속 커지지 않도록 한 단계만 보관 (profile.jsonl → profile.jsonl.1)
+    try:
+        if PROFILE_LOG_MAX_BYTES > 0 and os.path.getsize(log_path) >= PROFILE_LOG_MAX_BYTES:
+            os.replace(log_path, log_path + ".1")
+    except FileNotFoundError:
+        pass
+
+def current_run():
+    return _current.get()
+
+def start_span(name):
+    # 기록 중이 아니어도 써도 됨 (아무것도 안 남김)
+    return Span(_current.get(), name)
+
+@contextlib.contextmanager
+def span(name):
+    s = start_span(name)
+    try:
+        yield s
+    finally:
+        s.end()
+
+def record(kind, sql, params, rows, started, cached=False, explain=None):
+    # get_data / 쓰기 트랜잭션에서 호출 (기록 중이 아니면 바로 반환)
+    run = _current.get()
+    if run is None:
+        return
+    ms = (time.perf_counter() - started) * 1000
+    slow = ms >= SLOW_QUERY_MS
+    entry = {
+        "kind": kind,
+        "sql": re.sub(r"\s+", " ", sql).strip(),
+        "params": len(params) if params is not None else 0,
+        "rows": rows,
+        "ms": round(ms, 3),
+        "cached": cached,
+        "slow": slow,
+    }
+    if slow and explain is not None:
+        try:
+            entry["plan"] = explain()
+        except Exception as e:
+            entry["plan"] = f"EXPLAIN 실패: {e}"
+    run.queries.append(entry)
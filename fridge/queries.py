@@ -0,0 +1,280 @@
+"""페이지별 조회/쓰기 쿼리"""
+import re
+import datetime
+
+from fridge.db import get_data
+
+EXPIRY_ALERT_DAYS = 3  # 며칠 이내면 "임박" 으로 볼지
+
+def get_dashboard_summary(days=EXPIRY_ALERT_DAYS):
+    # 홈 화면 지표 한 줄 (전체 스캔 없이 요약 테이블 + 날짜 범위 합)
+    today = datetime.date.today()
+    return get_data('''
+        SELECT s.ingredient_count, s.waste_total_g, s.points_total,
+               (SELECT coalesce(sum(item_count), 0) FROM expiry_calendar
+                 WHERE expiry_date BETWEEN ? AND ?) AS expiring_count
+        FROM dashboard_summary s WHERE s.id = 1
+    ''', (today.isoformat(), (today + datetime.timedelta(days=days)).isoformat())).iloc[0]
+
+POINTS_PER_LEVEL = 100
+HISTORY_PAGE_SIZE = 20
+
+# 재고 + 카탈로그 정보 (보관팁/분리배출은 필요할 때 조인)
+INVENTORY_SQL = '''
+    SELECT i.id, i.name, i.category, i.quantity, i.expiry_date, c.storage_type, c.storage_tip, c.disposal_rule
+    FROM ingredients i LEFT JOIN food_catalog c ON c.id = i.food_id
+'''
+
+# 소비기한 알림: 남은 일수와 긴급도를 SQL 에서 계산, 소비기한 인덱스 순서대로 읽음
+EXPIRY_SQL = '''
+    SELECT i.id, i.name, i.quantity, i.expiry_date, c.storage_tip,
+           CAST(julianday(i.expiry_date) - julianday(?1) AS INTEGER) AS days_left,
+           CASE WHEN i.expiry_date < ?1 THEN '만료'
+                WHEN i.expiry_date <= date(?1, '+' || ?2 || ' days') THEN '임박'
+                ELSE '여유' END AS urgency
+    FROM ingredients i LEFT JOIN food_catalog c ON c.id = i.food_id
+    WHERE i.expiry_date IS NOT NULL AND i.expiry_date <= ?4
+    ORDER BY i.expiry_date, i.id
+    LIMIT ?3
+'''
+EXPIRY_LIST_LIMIT = 200  # 알림 화면 목록/일괄 처리에 올리는 최대 재료 수 (나머지는 식재료 관리 화면에서)
+
+def get_expiry_items(limit=-1, alert_days=EXPIRY_ALERT_DAYS, urgent_only=False):
+    # 소비기한이 가까운 순으로 limit 개 (-1 이면 전체)
+    # urgent_only: 임박/만료(오늘 + alert_days 까지)만 → 소비기한 인덱스의 앞쪽 범위만 읽음
+    today = datetime.date.today()
+    until = (today + datetime.timedelta(days=alert_days)).isoformat() if urgent_only else "9999-12-31"
+    return get_data(EXPIRY_SQL, (today.isoformat(), alert_days, limit, until))
+
+INVENTORY_PAGE_SIZE = 50
+
+def like_pattern(term):
+    # LIKE 부분 일치 패턴 (%, _ 는 글자 그대로 찾도록 이스케이프, ESCAPE '\\' 와 같이 사용)
+    return "%" + re.sub(r"([\\%_])", r"\\\1", term) + "%"
+
+def get_categories():
+    # 필터 선택지 (종류 인덱스만 읽음)
+    return get_data("SELECT DISTINCT category FROM ingredients WHERE category IS NOT NULL ORDER BY category")['category'].tolist()
+
+def get_fridge_names():
+    # 냉장고에 있는 재료 이름 (중복 없이, 레시피 추천 재료 선택지)
+    return get_data("SELECT DISTINCT name FROM ingredients WHERE name IS NOT NULL")['name'].tolist()
+
+def get_inventory_page(after=None, category=None, name=None, limit=INVENTORY_PAGE_SIZE):
+    # 소비기한 순 재고 한 페이지 (종류/이름 필터 + OFFSET 대신 (expiry_date, id) 커서)
+    # 다음 페이지가 있는지 알 수 있게 limit + 1 줄을 가져옴
+    where, params = [], []
+    if category:
+        where.append("i.category = ?")
+        params.append(category)
+    if name:
+        where.append("i.name LIKE ? ESCAPE '\\'")
+        params.append(like_pattern(name))
+    if after is not None:
+        if after[0] is None:
+            # 소비기한 없는 재료(정렬 맨 앞)에서 이어갈 때: 남은 NULL 재료 + 날짜 있는 재료 전부
+            where.append("(i.expiry_date IS NOT NULL OR i.id > ?)")
+            params.append(after[1])
+        else:
+            where.append("(i.expiry_date, i.id) > (?, ?)")
+            params += [after[0], after[1]]
+    query = INVENTORY_SQL
+    if where:
+        query += " WHERE " + " AND ".join(where)
+    query += " ORDER BY i.expiry_date, i.id LIMIT ?"
+    return get_data(query, tuple(params) + (limit + 1,))
+
+def add_ingredient(tx, name, category, quantity, expiry_date, storage_tip="", disposal_rule=""):
+    # 카탈로그에 없는 음식이면 먼저 등록 (입력한 팁/규칙은 빈 칸만 채움), 재고는 id 로 참조
+    tx.execute(
+        "INSERT INTO food_catalog (name, category, storage_tip, disposal_rule) VALUES (?, ?, nullif(?, ''), nullif(?, '')) "
+        "ON CONFLICT(name) DO UPDATE SET storage_tip = coalesce(food_catalog.storage_tip, excluded.storage_tip), "
+        "disposal_rule = coalesce(food_catalog.disposal_rule, excluded.disposal_rule)",
+        (name, category, storage_tip, disposal_rule)
+    )
+    tx.execute(
+        "INSERT INTO ingredients (food_id, name, category, quantity, expiry_date) "
+        "SELECT id, ?, ?, ?, ? FROM food_catalog WHERE name = ?",
+        (name, category, quantity, expiry_date, name)
+    )
+
+def add_ingredients(tx, rows):
+    # 여러 재료를 한 번에 등록 (rows: (name, category, quantity, expiry_date) 목록)
+    tx.executemany(
+        "INSERT INTO food_catalog (name, category) VALUES (?, ?) ON CONFLICT(name) DO NOTHING",
+        [(name, category) for name, category, _, _ in rows]
+    )
+    tx.executemany(
+        "INSERT INTO ingredients (food_id, name, category, quantity, expiry_date) "
+        "SELECT id, ?, ?, ?, ? FROM food_catalog WHERE name = ?",
+        [(name, category, quantity, expiry_date, name) for name, category, quantity, expiry_date in rows]
+    )
+
+def log_waste(tx, rows):
+    # 음식물 쓰레기 기록 여러 건 (rows: (waste_date, amount_g) 목록)
+    tx.executemany("INSERT INTO waste_log (waste_date, amount_g) VALUES (?, ?)", rows)
+
+def award_points(tx, description, points):
+    # 포인트 적립 (잔액/원장은 트리거가 갱신하므로 INSERT 한 번이면 끝)
+    tx.execute("INSERT INTO user_points (description, points) VALUES (?, ?)", (description, points))
+
+EAT_POINTS = 30        # 버리지 않고 먹으면 적립되는 포인트
+DISCARD_WASTE_G = 300  # 버린 재료 하나당 기록할 음식물 쓰레기 양 (대략)
+
+def consume_ingredient(tx, ingredient_id, amount=1):
+    # 수량만 amount 만큼 줄임 (남은 수량보다 많이는 못 먹음), 0 이 되면 그때 재고에서 삭제 + 포인트
+    # 반환: 남은 수량 (없는 재료이거나 남은 수량이 모자라면 None)
+    rows = tx.execute(
+        "UPDATE ingredients SET quantity = coalesce(quantity, 1) - ?1 "
+        "WHERE id = ?2 AND coalesce(quantity, 1) >= ?1 RETURNING food_id, name, quantity",
+        (amount, int(ingredient_id))
+    ).fetchall()
+    if not rows:
+        return None
+    food_id, name, remaining = rows[0]
+    tx.execute(
+        "INSERT INTO consumption_log (ingredient_id, food_id, name, amount, remaining) VALUES (?, ?, ?, ?, ?)",
+        (int(ingredient_id), food_id, name, amount, remaining)
+    )
+    if remaining <= 0:
+        archive_ingredients(tx, [ingredient_id], "eaten")
+        award_points(tx, f"{name} 알뜰 사용", EAT_POINTS)
+    return remaining
+
+def get_consumption_log(limit=HISTORY_PAGE_SIZE):
+    # 최근 먹은 기록
+    return get_data(
+        "SELECT consumed_at, name, amount, remaining FROM consumption_log ORDER BY id DESC LIMIT ?", (limit,)
+    )
+
+# 여러 재료를 한 번에 처리 (items: (id, name) 목록, 부수 효과까지 한 트랜잭션 안에서 executemany)
+# 기록/포인트/쓰레기는 모두 "INSERT ... SELECT ... FROM ingredients WHERE id = ?" 로 넣어서
+# 이미 처리된(재고에 없는) 재료를 다시 눌러도 포인트나 쓰레기가 중복으로 쌓이지 않음
+def _unique_ids(items):
+    return [(i,) for i in dict.fromkeys(int(ingredient_id) for ingredient_id, _ in items)]
+
+def eat_ingredients(tx, items):
+    # 남은 수량을 전부 먹음 → 먹은 기록 + 포인트 + 재고 삭제
+    ids = _unique_ids(items)
+    tx.executemany(
+        "INSERT INTO consumption_log (ingredient_id, food_id, name, amount, remaining) "
+        "SELECT id, food_id, name, coalesce(quantity, 1), 0 FROM ingredients WHERE id = ?", ids
+    )
+    tx.executemany(
+        "INSERT INTO user_points (description, points) "
+        "SELECT name || ' 알뜰 사용', ? FROM ingredients WHERE id = ?", [(EAT_POINTS, i) for (i,) in ids]
+    )
+    archive_ingredients(tx, [i for (i,) in ids], "eaten")
+
+def discard_ingredients(tx, items, amount_g=DISCARD_WASTE_G):
+    ids = _unique_ids(items)
+    today = datetime.date.today()
+    tx.executemany(
+        "INSERT INTO waste_log (waste_date, amount_g) SELECT ?, ? FROM ingredients WHERE id = ?",
+        [(today, amount_g, i) for (i,) in ids]
+    )
+    archive_ingredients(tx, [i for (i,) in ids], "discarded")
+
+def delete_ingredients(tx, ids):
+    archive_ingredients(tx, ids, "deleted")
+
+def archive_ingredients(tx, ids, outcome):
+    # 재고에서 빼면서 이력 테이블로 옮김 (outcome: eaten / discarded / deleted / expired)
+    rows = [(outcome, int(i)) for i in ids]
+    tx.executemany(
+        "INSERT OR REPLACE INTO ingredient_history (id, food_id, name, category, quantity, expiry_date, outcome) "
+        "SELECT id, food_id, name, category, quantity, expiry_date, ? FROM ingredients WHERE id = ?", rows
+    )
+    tx.executemany("DELETE FROM ingredients WHERE id = ?", [(i,) for _, i in rows])
+
+def get_history_summary():
+    # 처리 결과별 건수 (이력 테이블 인덱스만 읽음)
+    return get_data("SELECT outcome, count(*) AS n FROM ingredient_history GROUP BY outcome")
+
+def set_quantities(tx, ids, quantity):
+    tx.executemany("UPDATE ingredients SET quantity = ? WHERE id = ?", [(quantity, int(i)) for i in ids])
+
+def get_point_balance():
+    # 현재 잔액 (요약 테이블 한 줄, 내역 개수와 무관)
+    return int(get_data("SELECT points_total FROM dashboard_summary WHERE id = 1").iloc[0]['points_total'])
+
+def get_points_history(before=None, limit=HISTORY_PAGE_SIZE):
+    # 최신순 포인트 내역 한 페이지 (OFFSET 대신 (action_date, id) 커서로 이어서 조회)
+    # 다음 페이지가 있는지 알 수 있게 limit + 1 줄을 가져옴
+    columns = "id, action_date, description, points, balance_after"
+    if before is None:
+        return get_data(
+            f"SELECT {columns} FROM user_points ORDER BY action_date DESC, id DESC LIMIT ?",
+            (limit + 1,)
+        )
+    return get_data(
+        f"SELECT {columns} FROM user_points WHERE (action_date, id) < (?, ?) "
+        "ORDER BY action_date DESC, id DESC LIMIT ?",
+        (before[0], before[1], limit + 1)
+    )
+
+MAX_CHART_POINTS = 300  # 차트에 넘기는 최대 점 개수
+
+def get_first_waste_day():
+    # 첫 쓰레기 기록 날짜 (집계 테이블 PK 로 바로 찾음), 기록이 없으면 None
+    first_day = get_data("SELECT min(bucket) AS d FROM waste_rollup WHERE grain = 'day'").iloc[0]['d']
+    return datetime.date.fromisoformat(first_day) if first_day else None
+
+def pick_waste_grain(start, end):
+    # 기간 길이에 맞춰 점이 MAX_CHART_POINTS 개를 넘지 않는 가장 촘촘한 단위 선택
+    days = (end - start).days + 1
+    if days <= MAX_CHART_POINTS:
+        return "day"
+    if days / 7 <= MAX_CHART_POINTS:
+        return "week"
+    return "month"
+
+def get_waste_series(start, end):
+    # 집계 테이블에서 기간 안의 구간만 범위 조회 (원본 로그 행 수와 무관)
+    grain = pick_waste_grain(start, end)
+    if grain == "week":
+        start = start - datetime.timedelta(days=start.weekday())
+    elif grain == "month":
+        start = start.replace(day=1)
+    df = get_data(
+        "SELECT bucket, total_g FROM waste_rollup WHERE grain = ? AND bucket BETWEEN ? AND ? ORDER BY bucket",
+        (grain, start.isoformat(), end.isoformat())
+    )
+    return grain, df
+
+SEARCH_LIMIT = 50
+
+def search_guide(term, limit=SEARCH_LIMIT):
+    # 분리배출 가이드 검색 (검색어는 항상 파라미터로 바인딩)
+    term = term.strip()
+    if len(term) >= 3:
+        # 이름·분리배출·보관팁 전문 검색, 이름에 걸린 결과를 bm25 로 더 위에
+        phrase = '"' + term.replace('"', '""') + '"'
+        return get_data('''
+            SELECT c.name, c.disposal_rule, c.storage_tip
+            FROM food_catalog_fts f JOIN food_catalog c ON c.id = f.rowid
+            WHERE food_catalog_fts MATCH ?
+            ORDER BY bm25(food_catalog_fts, 10.0, 1.0, 1.0)
+            LIMIT ?
+        ''', (phrase, limit))
+    # trigram 색인은 3글자 이상부터 동작 → "계란" 같은 짧은 검색어는
+    # 1) 이름이 검색어로 시작하는 음식을 이름 인덱스 범위(name >= 검색어 AND name < 검색어 + U+10FFFF)로 먼저 찾고
+    # 2) 자리가 남을 때만 LIKE 부분 일치(이름 일치 먼저)로 나머지를 채움 (카탈로그 전체를 읽는 건 이때뿐)
+    import pandas as pd
+    prefix = get_data('''
+        SELECT name, disposal_rule, storage_tip FROM food_catalog
+        WHERE name >= ?1 AND name < ?1 || char(1114111)
+        ORDER BY name
+        LIMIT ?2
+    ''', (term, limit))
+    if len(prefix) >= limit:
+        return prefix
+    pattern = like_pattern(term)
+    rest = get_data('''
+        SELECT name, disposal_rule, storage_tip FROM food_catalog
+        WHERE NOT (name >= ?2 AND name < ?2 || char(1114111))
+          AND (name LIKE ?1 ESCAPE '\\' OR disposal_rule LIKE ?1 ESCAPE '\\' OR storage_tip LIKE ?1 ESCAPE '\\')
+        ORDER BY name NOT LIKE ?1 ESCAPE '\\', length(name), name
+        LIMIT ?3
+    ''', (pattern, term, limit - len(prefix)))
+    return pd.concat([prefix, rest], ignore_index=True)
@@ -0,0 +1,81 @@
+"""레시피 추천 (recipes / recipe_ingredients 테이블)"""
+import re
+import json
+
+from fridge.db import get_data, transaction
+from fridge.queries import get_fridge_names
+
+def normalize_ingredient(name):
+    # "치킨(남은것)" → "치킨" 처럼 괄호 메모와 앞뒤 공백 제거
+    return re.sub(r"\(.*?\)", "", str(name)).strip()
+
+def split_ingredients(text):
+    # "치킨, 마요네즈" → ["치킨", "마요네즈"] (정확히 일치하는 토큰 단위로 비교)
+    tokens = (normalize_ingredient(t) for t in str(text).split(","))
+    return [t for t in tokens if t]
+
+# 냉장고(또는 선택한) 재료로 만들 수 있는 레시피를 SQL 한 번으로 집계
+# {source} 자리에 "보유 재료" 목록을 만드는 SELECT 가 들어감
+RECIPE_MATCH_SQL = '''
+    WITH have(ingredient) AS ({source}),
+    top AS (
+        SELECT r.id, r.ingredient_count AS total, count(*) AS hit
+        FROM have
+        JOIN recipe_ingredients ri ON ri.ingredient = have.ingredient
+        JOIN recipes r ON r.id = ri.recipe_id
+        GROUP BY r.id
+        ORDER BY hit * 1.0 / total DESC, total - hit, r.id
+        LIMIT ?
+    )
+    SELECT r.name AS 레시피, r.kind AS 유형, r.calories AS 칼로리,
+           top.hit * 100 / top.total AS 일치율,
+           coalesce((SELECT group_concat(x.ingredient, ', ') FROM recipe_ingredients x
+                      WHERE x.recipe_id = top.id AND x.ingredient IN have), '') AS 보유재료,
+           coalesce((SELECT group_concat(x.ingredient, ', ') FROM recipe_ingredients x
+                      WHERE x.recipe_id = top.id AND x.ingredient NOT IN have), '') AS 부족재료
+    FROM top JOIN recipes r ON r.id = top.id
+    ORDER BY top.hit * 1.0 / top.total DESC, top.total - top.hit, top.id
+'''
+
+def recommend_recipes(selected=None, top_k=10):
+    # 충족률 높은 순 → 부족 재료 적은 순으로 상위 k개
+    # selected 가 없으면 냉장고(ingredients) 전체 재료 기준
+    # 두 경우 모두 같은 정규화("치킨(남은것)" → "치킨")를 거친 이름 목록을 json_each 로 넘김
+    if not selected:
+        selected = get_fridge_names()
+    have = sorted({normalize_ingredient(x) for x in selected} - {""})
+    query = RECIPE_MATCH_SQL.format(source="SELECT value FROM json_each(?)")
+    return get_data(query, (json.dumps(have, ensure_ascii=False), top_k))
+
+def load_recipes(csv_file, chunksize=5000):
+    # 대용량 레시피 CSV(레시피, 필요재료, 유형, 칼로리)를 청크 단위로 upsert
+    # 같은 이름의 레시피는 덮어쓰므로 여러 번 불러와도 중복되지 않음
+    import pandas as pd
+
+    total = 0
+    for chunk in pd.read_csv(csv_file, chunksize=chunksize):
+        recipe_rows = []
+        link_rows = []
+        for name, text, kind, kcal in zip(chunk["레시피"], chunk["필요재료"], chunk["유형"], chunk["칼로리"]):
+            ings = sorted(set(split_ingredients(text)))
+            recipe_rows.append((name, kind, int(kcal) if pd.notna(kcal) else None, len(ings)))
+            link_rows.extend((ing, name) for ing in ings)
+
+        # 청크마다 한 번만 커밋 (청크 사이에는 쓰기 락을 풀어서 다른 세션도 끼어들 수 있게)
+        with transaction() as tx:
+            tx.executemany(
+                "INSERT INTO recipes (name, kind, calories, ingredient_count) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET kind = excluded.kind, calories = excluded.calories, "
+                "ingredient_count = excluded.ingredient_count",
+                recipe_rows
+            )
+            tx.executemany(
+                "DELETE FROM recipe_ingredients WHERE recipe_id = (SELECT id FROM recipes WHERE name = ?)",
+                [(row[0],) for row in recipe_rows]
+            )
+            tx.executemany(
+                "INSERT OR IGNORE INTO recipe_ingredients (recipe_id, ingredient) SELECT id, ? FROM recipes WHERE name = ?",
+                link_rows
+            )
+        total += len(recipe_rows)
+    return total
@@ -0,0 +1,375 @@
+"""스키마 마이그레이션 (PRAGMA user_version 기준)"""
+import sqlite3
+
+# MIGRATIONS[i] 를 적용하면 user_version 이 i+1 이 됩니다.
+# 이미 배포된 항목은 고치지 말고, 스키마를 바꿀 때는 맨 뒤에 새 항목을 추가하세요.
+MIGRATIONS = [
+    # v1: 식재료 + 음식물 쓰레기 로그 (project.py 시절 스키마)
+    '''
+    CREATE TABLE IF NOT EXISTS ingredients (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT,          -- 재료명
+        category TEXT,      -- 종류
+        quantity INTEGER,   -- 수량
+        expiry_date DATE,   -- 유통기한
+        storage_tip TEXT,   -- 보관 꿀팁
+        disposal_rule TEXT  -- 분리배출 규칙
+    );
+    CREATE TABLE IF NOT EXISTS waste_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        waste_date DATE,
+        amount_g INTEGER
+    );
+    ''',
+    # v2: 포인트 로그 테이블
+    '''
+    CREATE TABLE IF NOT EXISTS user_points (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        action_date DATETIME DEFAULT CURRENT_TIMESTAMP,
+        description TEXT,
+        points INTEGER
+    );
+    ''',
+    # v3: 레시피 카탈로그 + 재료 역색인 (recipe_ingredients 의 PK 가 곧 재료 → 레시피 색인)
+    '''
+    CREATE TABLE IF NOT EXISTS recipes (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT UNIQUE,          -- 레시피명
+        kind TEXT,                 -- 유형
+        calories INTEGER,          -- 칼로리
+        ingredient_count INTEGER   -- 필요재료 개수 (일치율 계산용)
+    );
+    CREATE TABLE IF NOT EXISTS recipe_ingredients (
+        recipe_id INTEGER REFERENCES recipes(id),
+        ingredient TEXT,
+        PRIMARY KEY (ingredient, recipe_id)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_recipe_ingredients_recipe ON recipe_ingredients(recipe_id);
+
+    -- 기본 레시피 (예전에 페이지 안에 하드코딩되어 있던 것)
+    INSERT OR IGNORE INTO recipes (name, kind, calories, ingredient_count) VALUES
+        ('계란후라이', '간단요리', 120, 1),
+        ('치킨마요덮밥', '배달음식재활용', 700, 2),
+        ('상추샐러드', '다이어트', 80, 2),
+        ('두부김치', '한식', 400, 2),
+        ('제육볶음', '메인요리', 600, 2);
+    INSERT OR IGNORE INTO recipe_ingredients (recipe_id, ingredient)
+        SELECT r.id, x.column2 FROM recipes r JOIN (VALUES
+            ('계란후라이', '계란'),
+            ('치킨마요덮밥', '치킨'), ('치킨마요덮밥', '마요네즈'),
+            ('상추샐러드', '상추'), ('상추샐러드', '채소'),
+            ('두부김치', '두부'), ('두부김치', '김치'),
+            ('제육볶음', '돼지고기'), ('제육볶음', '양파')
+        ) x ON x.column1 = r.name;
+    ''',
+    # v4: 홈 화면 요약 (트리거로 항상 최신 상태 유지 → 홈은 한 줄만 읽음)
+    '''
+    CREATE TABLE IF NOT EXISTS dashboard_summary (
+        id INTEGER PRIMARY KEY CHECK (id = 1),  -- 항상 한 줄
+        ingredient_count INTEGER NOT NULL DEFAULT 0,
+        waste_total_g INTEGER NOT NULL DEFAULT 0,
+        points_total INTEGER NOT NULL DEFAULT 0
+    );
+    -- 유통기한 날짜별 식재료 수 (임박 개수 = 오늘~N일 뒤 날짜 N+1줄의 합)
+    CREATE TABLE IF NOT EXISTS expiry_calendar (
+        expiry_date DATE PRIMARY KEY,
+        item_count INTEGER NOT NULL
+    ) WITHOUT ROWID;
+
+    INSERT OR REPLACE INTO dashboard_summary (id, ingredient_count, waste_total_g, points_total) VALUES (
+        1,
+        (SELECT count(*) FROM ingredients),
+        (SELECT coalesce(sum(amount_g), 0) FROM waste_log),
+        (SELECT coalesce(sum(points), 0) FROM user_points)
+    );
+    INSERT OR REPLACE INTO expiry_calendar (expiry_date, item_count)
+        SELECT expiry_date, count(*) FROM ingredients WHERE expiry_date IS NOT NULL GROUP BY expiry_date;
+
+    -- 식재료
+    CREATE TRIGGER IF NOT EXISTS trg_ingredients_summary_insert AFTER INSERT ON ingredients BEGIN
+        UPDATE dashboard_summary SET ingredient_count = ingredient_count + 1 WHERE id = 1;
+        INSERT INTO expiry_calendar (expiry_date, item_count) SELECT NEW.expiry_date, 1 WHERE NEW.expiry_date IS NOT NULL
+            ON CONFLICT(expiry_date) DO UPDATE SET item_count = item_count + 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_ingredients_summary_delete AFTER DELETE ON ingredients BEGIN
+        UPDATE dashboard_summary SET ingredient_count = ingredient_count - 1 WHERE id = 1;
+        UPDATE expiry_calendar SET item_count = item_count - 1 WHERE expiry_date = OLD.expiry_date;
+        DELETE FROM expiry_calendar WHERE expiry_date = OLD.expiry_date AND item_count <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_ingredients_summary_update AFTER UPDATE OF expiry_date ON ingredients
+    WHEN OLD.expiry_date IS NOT NEW.expiry_date BEGIN
+        UPDATE expiry_calendar SET item_count = item_count - 1 WHERE expiry_date = OLD.expiry_date;
+        DELETE FROM expiry_calendar WHERE expiry_date = OLD.expiry_date AND item_count <= 0;
+        INSERT INTO expiry_calendar (expiry_date, item_count) SELECT NEW.expiry_date, 1 WHERE NEW.expiry_date IS NOT NULL
+            ON CONFLICT(expiry_date) DO UPDATE SET item_count = item_count + 1;
+    END;
+
+    -- 음식물 쓰레기
+    CREATE TRIGGER IF NOT EXISTS trg_waste_summary_insert AFTER INSERT ON waste_log BEGIN
+        UPDATE dashboard_summary SET waste_total_g = waste_total_g + coalesce(NEW.amount_g, 0) WHERE id = 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_waste_summary_delete AFTER DELETE ON waste_log BEGIN
+        UPDATE dashboard_summary SET waste_total_g = waste_total_g - coalesce(OLD.amount_g, 0) WHERE id = 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_waste_summary_update AFTER UPDATE OF amount_g ON waste_log BEGIN
+        UPDATE dashboard_summary SET waste_total_g = waste_total_g - coalesce(OLD.amount_g, 0) + coalesce(NEW.amount_g, 0) WHERE id = 1;
+    END;
+
+    -- 포인트
+    CREATE TRIGGER IF NOT EXISTS trg_points_summary_insert AFTER INSERT ON user_points BEGIN
+        UPDATE dashboard_summary SET points_total = points_total + coalesce(NEW.points, 0) WHERE id = 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_points_summary_delete AFTER DELETE ON user_points BEGIN
+        UPDATE dashboard_summary SET points_total = points_total - coalesce(OLD.points, 0) WHERE id = 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_points_summary_update AFTER UPDATE OF points ON user_points BEGIN
+        UPDATE dashboard_summary SET points_total = points_total - coalesce(OLD.points, 0) + coalesce(NEW.points, 0) WHERE id = 1;
+    END;
+    ''',
+    # v5: 포인트 원장 (적립 시점의 잔액을 같이 기록) + 내역 페이지용 (action_date, id) 인덱스
+    '''
+    ALTER TABLE user_points ADD COLUMN balance_after INTEGER;
+    UPDATE user_points SET balance_after = (
+        SELECT r.running FROM (
+            SELECT id, sum(points) OVER (ORDER BY id) AS running FROM user_points
+        ) r WHERE r.id = user_points.id
+    );
+    CREATE INDEX IF NOT EXISTS idx_user_points_history ON user_points(action_date, id);
+
+    -- 적립 트리거가 잔액(dashboard_summary.points_total)을 올린 뒤 그 값을 행에 기록
+    DROP TRIGGER IF EXISTS trg_points_summary_insert;
+    CREATE TRIGGER IF NOT EXISTS trg_points_ledger_insert AFTER INSERT ON user_points BEGIN
+        UPDATE dashboard_summary SET points_total = points_total + coalesce(NEW.points, 0) WHERE id = 1;
+        UPDATE user_points SET balance_after = (SELECT points_total FROM dashboard_summary WHERE id = 1)
+        WHERE id = NEW.id;
+    END;
+    ''',
+    # v6: 음식물 쓰레기 일/주/월 집계 (기록할 때마다 트리거로 누적)
+    '''
+    CREATE INDEX IF NOT EXISTS idx_waste_log_date ON waste_log(waste_date);
+    CREATE TABLE IF NOT EXISTS waste_rollup (
+        grain TEXT NOT NULL,      -- 'day' / 'week' / 'month'
+        bucket DATE NOT NULL,     -- 구간 시작일 (주는 월요일, 월은 1일)
+        total_g INTEGER NOT NULL,
+        entries INTEGER NOT NULL,
+        PRIMARY KEY (grain, bucket)
+    ) WITHOUT ROWID;
+
+    INSERT OR REPLACE INTO waste_rollup (grain, bucket, total_g, entries)
+        SELECT 'day', date(waste_date), sum(coalesce(amount_g, 0)), count(*)
+        FROM waste_log WHERE date(waste_date) IS NOT NULL GROUP BY 2;
+    INSERT OR REPLACE INTO waste_rollup (grain, bucket, total_g, entries)
+        SELECT 'week', date(waste_date, 'weekday 0', '-6 days'), sum(coalesce(amount_g, 0)), count(*)
+        FROM waste_log WHERE date(waste_date) IS NOT NULL GROUP BY 2;
+    INSERT OR REPLACE INTO waste_rollup (grain, bucket, total_g, entries)
+        SELECT 'month', date(waste_date, 'start of month'), sum(coalesce(amount_g, 0)), count(*)
+        FROM waste_log WHERE date(waste_date) IS NOT NULL GROUP BY 2;
+
+    CREATE TRIGGER IF NOT EXISTS trg_waste_rollup_insert AFTER INSERT ON waste_log
+    WHEN date(NEW.waste_date) IS NOT NULL BEGIN
+        INSERT INTO waste_rollup (grain, bucket, total_g, entries)
+            SELECT g.column1, g.column2, coalesce(NEW.amount_g, 0), 1 FROM (VALUES
+                ('day', date(NEW.waste_date)),
+                ('week', date(NEW.waste_date, 'weekday 0', '-6 days')),
+                ('month', date(NEW.waste_date, 'start of month'))
+            ) g WHERE true
+            ON CONFLICT(grain, bucket) DO UPDATE SET
+                total_g = total_g + excluded.total_g, entries = entries + 1;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_waste_rollup_delete AFTER DELETE ON waste_log
+    WHEN date(OLD.waste_date) IS NOT NULL BEGIN
+        UPDATE waste_rollup SET total_g = total_g - coalesce(OLD.amount_g, 0), entries = entries - 1
+        WHERE (grain, bucket) IN (VALUES
+            ('day', date(OLD.waste_date)),
+            ('week', date(OLD.waste_date, 'weekday 0', '-6 days')),
+            ('month', date(OLD.waste_date, 'start of month'))
+        );
+        DELETE FROM waste_rollup WHERE entries <= 0;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_waste_rollup_update AFTER UPDATE OF waste_date, amount_g ON waste_log BEGIN
+        UPDATE waste_rollup SET total_g = total_g - coalesce(OLD.amount_g, 0), entries = entries - 1
+        WHERE (grain, bucket) IN (VALUES
+            ('day', date(OLD.waste_date)),
+            ('week', date(OLD.waste_date, 'weekday 0', '-6 days')),
+            ('month', date(OLD.waste_date, 'start of month'))
+        );
+        DELETE FROM waste_rollup WHERE entries <= 0;
+        INSERT INTO waste_rollup (grain, bucket, total_g, entries)
+            SELECT g.column1, g.column2, coalesce(NEW.amount_g, 0), 1 FROM (VALUES
+                ('day', date(NEW.waste_date)),
+                ('week', date(NEW.waste_date, 'weekday 0', '-6 days')),
+                ('month', date(NEW.waste_date, 'start of month'))
+            ) g WHERE g.column2 IS NOT NULL
+            ON CONFLICT(grain, bucket) DO UPDATE SET
+                total_g = total_g + excluded.total_g, entries = entries + 1;
+    END;
+    ''',
+    # v7: 분리배출 가이드 검색용 전문 검색 색인 (trigram → 한글 부분 문자열도 검색됨)
+    '''
+    CREATE VIRTUAL TABLE IF NOT EXISTS ingredients_fts USING fts5(
+        name, disposal_rule, storage_tip,
+        content='ingredients', content_rowid='id', tokenize='trigram'
+    );
+    INSERT INTO ingredients_fts(ingredients_fts) VALUES ('rebuild');
+
+    CREATE TRIGGER IF NOT EXISTS trg_ingredients_fts_insert AFTER INSERT ON ingredients BEGIN
+        INSERT INTO ingredients_fts (rowid, name, disposal_rule, storage_tip)
+        VALUES (NEW.id, NEW.name, NEW.disposal_rule, NEW.storage_tip);
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_ingredients_fts_delete AFTER DELETE ON ingredients BEGIN
+        INSERT INTO ingredients_fts (ingredients_fts, rowid, name, disposal_rule, storage_tip)
+        VALUES ('delete', OLD.id, OLD.name, OLD.disposal_rule, OLD.storage_tip);
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_ingredients_fts_update AFTER UPDATE OF name, disposal_rule, storage_tip ON ingredients BEGIN
+        INSERT INTO ingredients_fts (ingredients_fts, rowid, name, disposal_rule, storage_tip)
+        VALUES ('delete', OLD.id, OLD.name, OLD.disposal_rule, OLD.storage_tip);
+        INSERT INTO ingredients_fts (rowid, name, disposal_rule, storage_tip)
+        VALUES (NEW.id, NEW.name, NEW.disposal_rule, NEW.storage_tip);
+    END;
+    ''',
+    # v8: 음식 기준 정보(food_catalog)와 냉장고 재고(ingredients) 분리
+    #     재고는 food_id 로 카탈로그를 참조하고, 보관팁/분리배출 규칙은 카탈로그에만 둠
+    '''
+    CREATE TABLE IF NOT EXISTS food_catalog (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        name TEXT NOT NULL,     -- 음식 이름 (자연키)
+        category TEXT,          -- 종류
+        default_days INTEGER,   -- 권장 보관일수
+        storage_type TEXT,      -- 냉장 / 냉동 / 실온
+        storage_tip TEXT,       -- 보관 꿀팁
+        disposal_rule TEXT      -- 분리배출 규칙
+    );
+    CREATE UNIQUE INDEX IF NOT EXISTS idx_food_catalog_name ON food_catalog(name);
+
+    -- 지금 재고에 복사되어 있던 정보를 이름당 한 줄로 옮김 (팁이 채워진 행 우선)
+    INSERT OR IGNORE INTO food_catalog (name, category, storage_tip, disposal_rule)
+        SELECT name, category, nullif(storage_tip, ''), nullif(disposal_rule, '')
+        FROM ingredients WHERE name IS NOT NULL
+        ORDER BY coalesce(storage_tip, '') = '', id;
+
+    ALTER TABLE ingredients ADD COLUMN food_id INTEGER REFERENCES food_catalog(id);
+    UPDATE ingredients SET food_id = (SELECT c.id FROM food_catalog c WHERE c.name = ingredients.name);
+    CREATE INDEX IF NOT EXISTS idx_ingredients_food ON ingredients(food_id);
+
+    -- 가이드 검색 색인도 카탈로그 쪽으로 이동
+    DROP TRIGGER IF EXISTS trg_ingredients_fts_insert;
+    DROP TRIGGER IF EXISTS trg_ingredients_fts_delete;
+    DROP TRIGGER IF EXISTS trg_ingredients_fts_update;
+    DROP TABLE IF EXISTS ingredients_fts;
+
+    CREATE VIRTUAL TABLE IF NOT EXISTS food_catalog_fts USING fts5(
+        name, disposal_rule, storage_tip,
+        content='food_catalog', content_rowid='id', tokenize='trigram'
+    );
+    INSERT INTO food_catalog_fts(food_catalog_fts) VALUES ('rebuild');
+
+    CREATE TRIGGER IF NOT EXISTS trg_food_catalog_fts_insert AFTER INSERT ON food_catalog BEGIN
+        INSERT INTO food_catalog_fts (rowid, name, disposal_rule, storage_tip)
+        VALUES (NEW.id, NEW.name, NEW.disposal_rule, NEW.storage_tip);
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_food_catalog_fts_delete AFTER DELETE ON food_catalog BEGIN
+        INSERT INTO food_catalog_fts (food_catalog_fts, rowid, name, disposal_rule, storage_tip)
+        VALUES ('delete', OLD.id, OLD.name, OLD.disposal_rule, OLD.storage_tip);
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_food_catalog_fts_update AFTER UPDATE OF name, disposal_rule, storage_tip ON food_catalog BEGIN
+        INSERT INTO food_catalog_fts (food_catalog_fts, rowid, name, disposal_rule, storage_tip)
+        VALUES ('delete', OLD.id, OLD.name, OLD.disposal_rule, OLD.storage_tip);
+        INSERT INTO food_catalog_fts (rowid, name, disposal_rule, storage_tip)
+        VALUES (NEW.id, NEW.name, NEW.disposal_rule, NEW.storage_tip);
+    END;
+
+    -- 재고 행에서는 복사본 컬럼 제거
+    ALTER TABLE ingredients DROP COLUMN storage_tip;
+    ALTER TABLE ingredients DROP COLUMN disposal_rule;
+    ''',
+    # v9: 소비기한을 'YYYY-MM-DD' 로 통일하고 인덱스 (임박 순 상위 k개를 인덱스 앞에서 바로 읽음)
+    '''
+    UPDATE ingredients SET expiry_date = date(expiry_date)
+    WHERE date(expiry_date) IS NOT NULL AND expiry_date <> date(expiry_date);
+    CREATE INDEX IF NOT EXISTS idx_ingredients_expiry ON ingredients(expiry_date);
+    ''',
+    # v10: 소비기한 알림 큐 (백그라운드 스케줄러가 기준일을 넘은 재료만 추가, 화면은 안 본 알림만 읽음)
+    '''
+    CREATE TABLE IF NOT EXISTS expiry_alerts (
+        ingredient_id INTEGER NOT NULL,
+        kind TEXT NOT NULL CHECK (kind IN ('임박', '만료')),
+        name TEXT,
+        expiry_date DATE,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        seen INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (ingredient_id, kind)
+    ) WITHOUT ROWID;
+    CREATE INDEX IF NOT EXISTS idx_expiry_alerts_unseen ON expiry_alerts(created_at) WHERE seen = 0;
+
+    -- 재료가 없어지거나 소비기한이 바뀌면 그 재료 알림도 정리 (바뀐 날짜 기준으로 다시 울림)
+    CREATE TRIGGER IF NOT EXISTS trg_ingredients_alerts_delete AFTER DELETE ON ingredients BEGIN
+        DELETE FROM expiry_alerts WHERE ingredient_id = OLD.id;
+    END;
+    CREATE TRIGGER IF NOT EXISTS trg_ingredients_alerts_update AFTER UPDATE OF expiry_date ON ingredients BEGIN
+        DELETE FROM expiry_alerts WHERE ingredient_id = OLD.id;
+    END;
+    ''',
+    # v11: 종류 필터 + 소비기한 순 페이지를 인덱스 순서대로 읽기 위한 인덱스 (종류 목록도 이 인덱스로)
+    '''
+    CREATE INDEX IF NOT EXISTS idx_ingredients_category ON ingredients(category, expiry_date);
+    ''',
+    # v12: 먹은 기록 (재고는 수량만 줄이고, 이력은 별도 테이블에 쌓음)
+    '''
+    CREATE TABLE IF NOT EXISTS consumption_log (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ingredient_id INTEGER,
+        food_id INTEGER,
+        name TEXT,
+        amount INTEGER NOT NULL,   -- 이번에 먹은 수량
+        remaining INTEGER,         -- 먹고 난 뒤 남은 수량 (0 이면 다 먹어서 재고에서 삭제됨)
+        consumed_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_consumption_log_food ON consumption_log(food_id, consumed_at);
+    ''',
+    # v13: 다 먹었거나/버렸거나/오래 지난 재료는 재고(ingredients)에서 빼서 이력 테이블로 (재고 테이블은 작게 유지)
+    '''
+    CREATE TABLE IF NOT EXISTS ingredient_history (
+        id INTEGER PRIMARY KEY,   -- 원래 ingredients.id (AUTOINCREMENT 라 겹치지 않음)
+        food_id INTEGER,
+        name TEXT,
+        category TEXT,
+        quantity INTEGER,         -- 옮길 때 남아 있던 수량
+        expiry_date DATE,
+        outcome TEXT NOT NULL CHECK (outcome IN ('eaten', 'discarded', 'deleted', 'expired')),
+        archived_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+    CREATE INDEX IF NOT EXISTS idx_ingredient_history_outcome ON ingredient_history(outcome, archived_at);
+    ''',
+]
+
+def _statements(script):
+    # executescript 는 열린 트랜잭션을 먼저 커밋해 버리므로 한 문장씩 나눔 (트리거의 BEGIN ... END 는 한 문장)
+    statement = ""
+    for part in script.split(";"):
+        statement += part + ";"
+        if sqlite3.complete_statement(statement):
+            if statement.strip(" \t\n;"):
+                yield statement
+            statement = ""
+
+def migrate(conn):
+    # 아직 적용되지 않은 마이그레이션만 순서대로 실행 (각 단계는 하나의 트랜잭션)
+    # 여러 프로세스(my.py, project.py, CLI)가 같은 파일을 동시에 열 수 있으므로
+    # 쓰기 락(BEGIN IMMEDIATE)을 먼저 잡고 그 안에서 버전을 다시 읽어, 이미 적용된 단계는 건너뜀
+    start = conn.execute("PRAGMA user_version").fetchone()[0]
+    if start >= len(MIGRATIONS):
+        return start
+    while True:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version >= len(MIGRATIONS):
+                conn.commit()
+                return start
+            for statement in _statements(MIGRATIONS[version]):
+                conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version + 1}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
@@ -0,0 +1,165 @@
+"""쓰기 지연(write-behind) 큐 (선택, FRIDGE_WRITE_BEHIND=1 일 때만)
+
+버튼 클릭이 디스크 커밋을 기다리지 않도록, 쓰기 함수를 큐에 넣고 바로 반환함.
+쓰기 전용 스레드 하나가 큐에 쌓인 쓰기를 모아 한 트랜잭션(그룹 커밋)으로 저장.
+
+    seq = submit(add_ingredient, name, kind, qty, expire)   # fn(tx, *args) 형태의 쓰기 함수
+    wait_for(seq)   # 이 세션이 쓴 내용을 읽기 전에 (자기 쓰기는 항상 보이도록)
+
+꺼져 있으면 submit 이 바로 transaction() 안에서 실행하고 0 을 반환 (기다릴 것 없음).
+반환값이 필요한 쓰기는 run_now(fn, *args) 로 큐를 거치지 않고 바로 커밋.
+"""
+import os
+import queue
+import atexit
+import threading
+import collections
+
+from fridge.db import _process_singleton, current_household, set_household, get_pool, transaction
+from fridge.alerts import wake_scheduler
+
+WRITE_BEHIND = os.environ.get("FRIDGE_WRITE_BEHIND", "") not in ("", "0")
+WRITE_QUEUE_SIZE = 1000  # 큐가 가득 차면 submit 이 기다림 (쓰기가 밀릴 때 메모리가 끝없이 늘지 않도록)
+GROUP_COMMIT_MAX = 64    # 한 번에 커밋할 최대 쓰기 수
+WAIT_TIMEOUT = 5.0       # 자기 쓰기를 기다리는 최대 시간(초)
+
+# 순번은 프로세스 전체에서 계속 증가 (가구가 닫혔다 다시 열려 쓰기 큐가 새로 만들어져도 0 부터 다시 세지 않음)
+# 새 큐는 지금까지 나간 순번까지 "저장 완료"로 시작 → 닫힌 큐의 순번을 들고 있는 세션이 기다리지 않음
+_seq_lock = threading.Lock()
+_last_seq = 0
+
+def _next_seq():
+    global _last_seq
+    with _seq_lock:
+        _last_seq += 1
+        return _last_seq
+
+def _issued_seq():
+    with _seq_lock:
+        return _last_seq
+
+class WriteBehind:
+    # - 쓰기마다 순번(seq)을 매겨 큐에 넣고, 커밋이 끝난 마지막 순번을 done 으로 공개
+    # - 한 쓰기가 실패해도 같은 묶음의 다른 쓰기는 저장되도록 쓰기마다 SAVEPOINT
+    def __init__(self, maxsize=WRITE_QUEUE_SIZE, group_max=GROUP_COMMIT_MAX):
+        self.group_max = group_max
+        self.errors = collections.deque(maxlen=20)  # 최근 실패한 쓰기 (seq, 함수 이름, 에러)
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._submit_lock = threading.Lock()
+        self._seq = self._done = _issued_seq()
+        self._done_cond = threading.Condition()
+        self._closed = False
+        self._thread = None
+        self.household = current_household()  # 스레드에서도 만든 가구의 DB 를 쓰도록
+        self.pool = get_pool()  # 가구가 닫힌 뒤에도 큐에 남은 쓰기를 같은 풀로 저장
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="fridge-write-behind", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)  # 종료할 때 큐에 남은 쓰기를 모두 저장
+        return self
+
+    def submit(self, fn, args=()):
+        with self._submit_lock:  # 순번 순서 = 큐 순서
+            if self._closed:
+                raise RuntimeError("write-behind 큐가 이미 닫혔습니다")
+            seq = self._seq = _next_seq()
+            self._queue.put((seq, fn, args))
+        return seq
+
+    def _run(self):
+        set_household(self.household)
+        stop = False
+        while not stop:
+            job = self._queue.get()
+            if job is None:
+                break
+            batch = [job]
+            while len(batch) < self.group_max:
+                try:
+                    job = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    stop = True
+                    break
+                batch.append(job)
+            self._commit(batch)
+
+    def _commit(self, batch):
+        try:
+            with transaction(self.pool) as tx:
+                for seq, fn, args in batch:
+                    tx.execute("SAVEPOINT write_behind")
+                    try:
+                        fn(tx, *args)
+                    except Exception as e:
+                        tx.execute("ROLLBACK TO write_behind")
+                        self._fail(seq, fn, e)
+                    tx.execute("RELEASE write_behind")
+            wake_scheduler()  # 커밋이 끝난 뒤에 깨워야 스케줄러가 새 재료를 봄
+        except Exception as e:
+            for seq, fn, _ in batch:
+                self._fail(seq, fn, e)
+        finally:
+            with self._done_cond:
+                self._done = batch[-1][0]
+                self._done_cond.notify_all()
+
+    def _fail(self, seq, fn, error):
+        self.errors.append((seq, fn.__name__, str(error)))
+        print(f"❌ 쓰기 실패 ({fn.__name__}): {error}")
+
+    def busy(self):
+        # 큐에 넣었지만 아직 커밋 안 된 쓰기가 있으면 True (이 가구는 닫지 않음)
+        with self._done_cond:
+            return self._done < self._seq
+
+    def wait_for(self, seq, timeout=WAIT_TIMEOUT):
+        # seq 번 쓰기까지 커밋되면 True (timeout 이 지나면 False)
+        with self._done_cond:
+            return self._done_cond.wait_for(lambda: self._done >= seq, timeout)
+
+    def flush(self, timeout=None):
+        return self.wait_for(self._seq, timeout)
+
+    def close(self):
+        # 더 이상 받지 않고, 큐에 남은 쓰기를 모두 커밋한 뒤 종료
+        with self._submit_lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._queue.put(None)
+        atexit.unregister(self.close)  # 가구가 자주 열리고 닫혀도 종료 목록에 닫힌 큐가 쌓이지 않도록
+        if self._thread is not None:
+            self._thread.join()
+
+def get_writer():
+    return _process_singleton("writer", lambda: WriteBehind().start())
+
+def submit(fn, *args):
+    # fn(tx, *args) 를 저장, 이 쓰기의 순번을 반환 (꺼져 있으면 바로 커밋하고 0)
+    if not WRITE_BEHIND:
+        run_now(fn, *args)
+        return 0
+    return get_writer().submit(fn, args)
+
+def run_now(fn, *args):
+    # 결과가 바로 필요한 쓰기: 큐를 거치지 않고 지금 커밋하고 fn(tx, *args) 의 반환값을 돌려줌
+    with transaction() as tx:
+        result = fn(tx, *args)
+    wake_scheduler()
+    return result
+
+def failed_writes(seqs):
+    # seqs 중 저장에 실패한 쓰기의 (함수 이름, 에러) 목록 (큐를 쓸 때만, 아니면 에러가 바로 올라옴)
+    if not WRITE_BEHIND or not seqs:
+        return []
+    seqs = set(seqs)
+    return [(name, error) for seq, name, error in get_writer().errors if seq in seqs]
+
+def wait_for(seq, timeout=WAIT_TIMEOUT):
+    # 이 세션이 마지막으로 넣은 쓰기가 커밋될 때까지 기다림 (read-your-writes)
+    if seq and WRITE_BEHIND:
+        return get_writer().wait_for(seq, timeout)
+    return True
@@ -1,93 +1,19 @@
 import streamlit as st
 import pandas as pd
 import datetime
-import sqlite3
-import os
 
-# ==============================
-# 1. DB 연결 및 초기 설정
-# ==============================
+from fridge.buffer import ColumnBuffer
+from fridge.db import init_db
+from fridge.queries import add_ingredients, log_waste
 
-@st.cache_resource
-def get_connection():
-    conn = sqlite3.connect('fridge.db', check_same_thread=False)
-    return conn
-
-def init_db():
-    conn = get_connection()
-    c = conn.cursor()
-    
-    # (1) 식재료 테이블 (컬럼을 CSV 정보에 맞춰 확장했습니다!)
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS ingredients (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            name TEXT,          -- 재료명
-            category TEXT,      -- 종류
-            quantity INTEGER,   -- 수량
-            expiry_date DATE,   -- 유통기한 (YYYY-MM-DD)
-            storage_tip TEXT,   -- 보관 꿀팁 (Task 5)
-            disposal_rule TEXT  -- 분리배출 규칙 (Task 4)
-        )
-    ''')
-
-    # (2) 음식물 쓰레기 로그 테이블
-    c.execute('''
-        CREATE TABLE IF NOT EXISTS waste_log (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            waste_date DATE,
-            amount_g INTEGER
-        )
-    ''')
-    conn.commit()
-    
-    # ==============================
-    # 🌟 CSV 데이터 자동 로드 로직
-    # ==============================
-    # 1. DB가 비어있는지 확인
-    c.execute("SELECT count(*) FROM ingredients")
-    count = c.fetchone()[0]
-    
-    if count == 0:  # 데이터가 하나도 없으면 실행
-        csv_file = 'food_data.csv'
-        
-        if os.path.exists(csv_file):
-            try:
-                # CSV 읽기
-                df = pd.read_csv(csv_file)
-                
-                # 데이터 가공: '오늘' 날짜 기준으로 유통기한 계산하기
-                today = datetime.date.today()
-                
-                # default_days(권장기간)를 더해서 expiry_date(날짜) 생성
-                df['expiry_date'] = df['default_days'].apply(
-                    lambda x: today + datetime.timedelta(days=int(x))
-                )
-                
-                # 수량 기본값 1로 설정
-                df['quantity'] = 1
-                
-                # DB 테이블 컬럼 이름과 순서 맞추기
-                # (CSV에는 있고 DB에는 없는 컬럼은 제외하고, 필요한 것만 뽑음)
-                db_df = df[[
-                    'name', 'category', 'quantity', 
-                    'expiry_date', 'storage_tip', 'disposal_rule'
-                ]]
-                
-                # DB에 한 번에 저장 (pandas to_sql 기능 활용)
-                db_df.to_sql('ingredients', conn, if_exists='append', index=False)
-                
-                print("✅ food_data.csv 데이터가 성공적으로 로드되었습니다.")
-                
-            except Exception as e:
-                print(f"❌ CSV 로드 중 오류 발생: {e}")
-        else:
-            print("⚠ food_data.csv 파일이 없습니다. 빈 DB로 시작합니다.")
+FLUSH_EVERY = 20  # 새로 추가한 행이 이만큼 쌓이면 fridge.db 에 한 번에 저장
 
-# 앱 실행 시 초기화 함수 실행
+# ==============================
+# 1. DB 초기 설정
+# ==============================
+# 스키마/기본 데이터는 my.py 와 같은 fridge 패키지에서 관리 (프로세스당 1회)
 init_db()
 
-
-
 # ==============================
 # 기본 설정 & 초록(푸릇한) 배경 테마
 # ==============================
@@ -120,8 +46,10 @@ st.divider()
 # ==============================
 # 세션 스테이트 초기값
 # ==============================
+# 행 추가가 잦은 표는 ColumnBuffer 에 보관 (추가는 O(1), DataFrame 은 그릴 때만 생성)
+# 샘플 행은 DB 에 저장하지 않음 (mark_flushed)
 if "ingredients" not in st.session_state:
-    st.session_state["ingredients"] = pd.DataFrame(
+    st.session_state["ingredients"] = ColumnBuffer.from_columns(
         {
             "식재료": ["계란", "우유", "상추", "치킨"],
             "종류": ["단백질", "유제품", "채소", "배달음식"],
@@ -134,9 +62,10 @@ if "ingredients" not in st.session_state:
             ],
         }
     )
+    st.session_state["ingredients"].mark_flushed()
 
 if "waste_log" not in st.session_state:
-    st.session_state["waste_log"] = pd.DataFrame(
+    st.session_state["waste_log"] = ColumnBuffer.from_columns(
         {
             "날짜": [
                 datetime.date.today() - datetime.timedelta(days=21),
@@ -147,6 +76,7 @@ if "waste_log" not in st.session_state:
             "배출량(g)": [800, 650, 500, 420],
         }
     )
+    st.session_state["waste_log"].mark_flushed()
 
 if "point" not in st.session_state:
     st.session_state["point"] = 40  # 대충 시작 포인트
@@ -167,6 +97,18 @@ menu = st.sidebar.radio(
     ],
 )
 
+# 세션에서 추가한 행을 fridge.db 에 묶어서 저장 (표마다 한 트랜잭션)
+def flush_session_data(force=False):
+    ingredients, waste_log = st.session_state["ingredients"], st.session_state["waste_log"]
+    if not force and len(ingredients.pending()) + len(waste_log.pending()) < FLUSH_EVERY:
+        return 0
+    return ingredients.flush(add_ingredients) + waste_log.flush(log_waste)
+
+pending = len(st.session_state["ingredients"].pending()) + len(st.session_state["waste_log"].pending())
+if pending and st.sidebar.button(f"💾 DB에 저장 ({pending}건 대기)", key="flush_session"):
+    st.toast(f"{flush_session_data(force=True)}건 저장했습니다.")
+    st.rerun()
+
 # ==============================
 # 0. 홈
 # ==============================
@@ -193,8 +135,14 @@ if menu == "홈":
         a, b = st.columns(2)
         c, d = st.columns(2)
 
+        # 임박 식재료 수 (오늘 ~ 3일 이내)
+        today = datetime.date.today()
+        expiring = sum(
+            0 <= (d - today).days <= 3 for d in st.session_state["ingredients"].column("유통기한")
+        )
+
         a.metric("이번 주 음식물 쓰레기", "420 g", "-80 g")
-        b.metric("임박 식재료 수", "2 개", "+1")
+        b.metric("임박 식재료 수", f"{expiring} 개")
         c.metric("총 등록 식재료", f"{len(st.session_state['ingredients'])} 개")
         d.metric("현재 포인트", f"{st.session_state['point']} P")
 
@@ -219,23 +167,20 @@ elif menu == "식재료 관리":
             if name.strip() == "":
                 st.warning("식재료명을 입력해 주세요.")
             else:
-                new_row = pd.DataFrame(
+                st.session_state["ingredients"].append(
                     {
-                        "식재료": [name],
-                        "종류": [kind],
-                        "수량": [qty],
-                        "유통기한": [expire],
+                        "식재료": name,
+                        "종류": kind,
+                        "수량": qty,
+                        "유통기한": expire,
                     }
                 )
-                st.session_state["ingredients"] = pd.concat(
-                    [st.session_state["ingredients"], new_row],
-                    ignore_index=True,
-                )
+                flush_session_data()
                 st.success(f"{name} 이(가) 등록되었습니다!")
 
     with right:
         st.subheader("현재 등록된 식재료")
-        st.dataframe(st.session_state["ingredients"])
+        st.dataframe(st.session_state["ingredients"].to_frame())
 
 # ==============================
 # 2. 소비기한 알림
@@ -244,7 +189,7 @@ elif menu == "식재료 관리":
 elif menu == "소비기한 알림":
     st.header("⏰ 소비기한 알림")
 
-    df = st.session_state["ingredients"].copy()
+    df = st.session_state["ingredients"].to_frame().copy()
 
     # 남은 일수 계산 (dt 안 쓰는 안전한 방식)
     def calc_days_left(d):
@@ -292,7 +237,7 @@ elif menu == "레시피 추천":
         }
     )
 
-    ingredients_list = sorted(st.session_state["ingredients"]["식재료"].unique().tolist())
+    ingredients_list = sorted(set(st.session_state["ingredients"].column("식재료")))
     selected_ing = st.multiselect("보유 재료 선택", ingredients_list, default=ingredients_list[:1])
 
     filtered = recipes.copy()
@@ -323,7 +268,7 @@ elif menu == "레시피 추천":
 elif menu == "음식물 쓰레기 분석":
     st.header("🗑 음식물 쓰레기 배출량 분석")
 
-    waste_df = st.session_state["waste_log"].copy()
+    waste_df = st.session_state["waste_log"].to_frame().copy()
     waste_df = waste_df.sort_values("날짜")
 
     st.subheader("기록된 배출량")
@@ -353,11 +298,8 @@ elif menu == "음식물 쓰레기 분석":
         new_amount = st.number_input("배출량(g)", min_value=0, step=10, value=300)
 
     if st.button("기록 추가"):
-        new_row = pd.DataFrame({"날짜": [new_date], "배출량(g)": [new_amount]})
-        st.session_state["waste_log"] = pd.concat(
-            [st.session_state["waste_log"], new_row],
-            ignore_index=True,
-        )
+        st.session_state["waste_log"].append({"날짜": new_date, "배출량(g)": new_amount})
+        flush_session_data()
         st.success("새로운 배출량 기록이 추가되었습니다.")
 
 # ==============================
@@ -0,0 +1,19 @@
+"""페이지 모듈 (메뉴를 처음 열 때 import, 이후 rerun 에서는 이미 로드된 모듈을 그대로 사용)
+
+각 모듈은 render() 하나를 가짐. Streamlit 은 pages/ 폴더를 멀티페이지 앱으로 자동 인식하므로 views/ 를 씀.
+"""
+import importlib
+
+# 메뉴 이름 -> 모듈 이름 (사이드바 순서)
+PAGES = {
+    "홈": "home",
+    "식재료 관리": "inventory",
+    "소비기한 알림": "expiry",
+    "레시피 추천": "recipes",
+    "음식물 쓰레기 분석": "waste",
+    "환경/분리배출 가이드": "guide",
+    "마이페이지(포인트)": "mypage",
+}
+
+def load(menu):
+    return importlib.import_module(f"views.{PAGES[menu]}")
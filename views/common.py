@@ -0,0 +1,50 @@
+"""여러 페이지에서 같이 쓰는 UI 조각"""
+import streamlit as st
+
+from fridge.writer import submit, run_now, wait_for
+from fridge.queries import EAT_POINTS, eat_ingredients, discard_ingredients, delete_ingredients, set_quantities
+
+# 쓰기는 모두 write() 로: FRIDGE_WRITE_BEHIND=1 이면 큐에 넣고 바로 반환 (커밋은 쓰기 스레드가 묶어서)
+# 이 세션의 마지막 쓰기 순번을 기억해 두고, 다음 rerun 에서 읽기 전에 그 쓰기까지 기다림
+def write(fn, *args):
+    seq = submit(fn, *args)
+    st.session_state["last_write_seq"] = seq
+    if seq:  # 저장에 실패하면 다음 rerun 에서 알려 주려고 순번을 모아 둠
+        st.session_state.setdefault("pending_write_seqs", []).append(seq)
+
+# 결과를 보고 안내해야 하는 쓰기(예: 남은 수량)는 큐에 넣지 않고 바로 커밋해서 반환값을 받음
+# 이 세션이 앞서 큐에 넣은 쓰기가 먼저 저장되도록 기다린 뒤 실행
+def write_now(fn, *args):
+    wait_for(st.session_state.get("last_write_seq", 0))
+    return run_now(fn, *args)
+
+# 여러 페이지에서 같이 쓰는 일괄 처리 UI
+def bulk_actions(df, key):
+    # 선택한 재료를 한 번에 먹음/버림/삭제/수량 변경 (한 트랜잭션으로 처리 → rerun 한 번)
+    ids = df['id'].tolist()
+    names = dict(zip(ids, df['name'].tolist()))
+    expiry = dict(zip(ids, df['expiry_date'].fillna("-").tolist()))
+    picked = st.multiselect("재료 선택 (입력해서 찾기)", ids, key=f"{key}_picked",
+                            format_func=lambda i: f"{i} - {names[i]} ({expiry[i]})")
+    items = [(i, names[i]) for i in picked]
+    
+    c1, c2, c3 = st.columns(3)
+    q1, q2 = st.columns([2, 1])
+    new_qty = q1.number_input("수량", 1, 100, 1, key=f"{key}_qty")
+    done = None
+    if c1.button("😋 다 먹음", key=f"{key}_eat", disabled=not items):
+        write(eat_ingredients, items)
+        done = f"{len(items)}개 사용 완료! +{EAT_POINTS * len(items)}P"
+    if c2.button("🗑 버림", key=f"{key}_trash", disabled=not items):
+        write(discard_ingredients, items)
+        done = f"{len(items)}개 버림 처리됨.."
+    if c3.button("❌ 삭제", key=f"{key}_delete", disabled=not items):
+        write(delete_ingredients, picked)
+        done = f"{len(items)}개 삭제되었습니다."
+    if q2.button("수량 변경", key=f"{key}_set_qty", disabled=not items):
+        write(set_quantities, picked, new_qty)
+        done = f"{len(items)}개 수량을 {new_qty}(으)로 변경했습니다."
+    if done:
+        del st.session_state[f"{key}_picked"]  # 처리한 재료는 선택 해제
+        st.toast(done)
+        st.rerun()
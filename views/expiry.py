@@ -0,0 +1,76 @@
+"""(2) 소비기한 알림 (DB 연동 + 액션 추가)"""
+import streamlit as st
+
+from fridge.alerts import count_new_alerts, get_new_alerts, mark_alerts_seen
+from fridge.queries import EAT_POINTS, EXPIRY_LIST_LIMIT, get_expiry_items, consume_ingredient, discard_ingredients
+from views.common import write, write_now, bulk_actions
+
+def render():
+    new_alert_count = count_new_alerts()
+    
+    st.header("⏰ 소비기한 알림")
+    
+    # 새 알림은 이 화면에서 한 번 보여주고 "봄" 처리 (배지에서 빠짐)
+    if new_alert_count:
+        alerts = get_new_alerts()
+        for alert in alerts.itertuples():
+            st.warning(f"🔔 [{alert.kind}] {alert.name} (소비기한 {alert.expiry_date})")
+        write(mark_alerts_seen, list(zip(alerts['ingredient_id'].tolist(), alerts['kind'].tolist())))
+    
+    # 남은 일수/긴급도는 SQL 에서 계산, 카드는 소비기한 인덱스 앞쪽 3개만 읽음
+    top_items = get_expiry_items(limit=3)
+    
+    if top_items.empty:
+        st.warning("데이터가 없습니다.")
+    else:
+        st.subheader("🚨 유통기한 임박 재료")
+        
+        # 카드 형태로 보여주기 (상위 3개)
+        cols = st.columns(3)
+        
+        for idx, row in enumerate(top_items.iterrows()):
+            data = row[1] # row 데이터
+            col_idx = idx % 3
+            
+            with cols[col_idx]:
+                st.info(f"**{data['name']}**")
+                days = int(data['days_left'])
+                
+                if data['urgency'] == "만료":
+                    st.error(f"😱 {abs(days)}일 지남!")
+                elif data['urgency'] == "임박":
+                    st.warning(f"⚠ {days}일 남음")
+                else:
+                    st.success(f"{days}일 남음")
+                
+                st.caption(f"남은 수량: {data['quantity']}")
+                
+                # 액션 버튼 (사용함 / 버림) - 먹으면 수량만 1 줄이고, 다 먹었을 때 삭제 + 포인트
+                c1, c2 = st.columns(2)
+                item = [(int(data['id']), data['name'])]
+                if c1.button("😋 1개 먹음", key=f"eat_{data['id']}"):
+                    # 화면의 수량이 아니라 실제로 줄어든 결과로 안내 (다른 탭에서 이미 처리했을 수 있음)
+                    remaining = write_now(consume_ingredient, data['id'])
+                    if remaining is None:
+                        st.toast(f"{data['name']} 은(는) 이미 처리되었거나 남은 수량이 없어요", icon="⚠️")
+                    elif remaining:
+                        st.toast(f"{data['name']} 1개 사용! {remaining}개 남음")
+                    else:
+                        st.toast(f"{data['name']} 다 먹었어요! +{EAT_POINTS}P")
+                    st.rerun()
+                    
+                if c2.button("🗑 버림", key=f"trash_{data['id']}"):
+                    write(discard_ingredients, item)
+                    st.toast(f"{data['name']} 버림 처리됨..")
+                    st.rerun()
+
+        st.divider()
+        # 재고 전체가 아니라 임박/만료 재료만 (많아도 EXPIRY_LIST_LIMIT 개까지)
+        st.subheader("임박/만료 목록")
+        df = get_expiry_items(limit=EXPIRY_LIST_LIMIT, urgent_only=True)
+        if len(df) == EXPIRY_LIST_LIMIT:
+            st.caption(f"소비기한이 가까운 {EXPIRY_LIST_LIMIT}개만 보여요. 나머지는 식재료 관리에서 확인하세요.")
+        st.dataframe(df[['name', 'expiry_date', 'days_left', 'urgency', 'storage_tip']].rename(
+            columns={'days_left': '남은일수', 'urgency': '상태'}))
+        with st.expander("🧺 여러 재료 한 번에 처리하기"):
+            bulk_actions(df, "expiry")
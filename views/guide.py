@@ -0,0 +1,31 @@
+"""(5) 환경/분리배출 가이드 (DB 검색 기능 추가)"""
+import streamlit as st
+
+from fridge.queries import search_guide
+
+def render():
+    st.header("♻ 환경 가이드 & 검색")
+    
+    st.info("💡 CSV에서 불러온 데이터를 여기서 검색할 수 있습니다.")
+    
+    search_term = st.text_input("재료 이름 검색 (예: 계란, 치킨)")
+    
+    if search_term:
+        # DB에서 검색 (전문 검색 색인, 검색어는 파라미터로 전달)
+        res = search_guide(search_term)
+        if not res.empty:
+            for idx, row in res.iterrows():
+                with st.expander(f"📌 {row['name']} 정보 보기", expanded=True):
+                    st.write(f"**🗑 분리배출:** {row['disposal_rule']}")
+                    st.write(f"**❄️ 보관꿀팁:** {row['storage_tip']}")
+        else:
+            st.warning("등록된 정보가 없습니다. (CSV에 없는 재료일 수 있습니다)")
+            
+    st.divider()
+    # 기존 탭 유지
+    t1, t2 = st.tabs(["일반 상식", "플라스틱 가이드"])
+    with t1:
+        st.write("- **음식물 쓰레기**: 동물 사료로 쓸 수 있는 것 (부드러운 것)")
+        st.write("- **일반 쓰레기**: 뼈, 껍데기, 씨앗, 티백 등")
+    with t2:
+        st.write("- 내용은 비우고, 라벨은 떼고, 찌그러트려서 배출!")
@@ -0,0 +1,36 @@
+"""(0) 홈"""
+import streamlit as st
+
+from fridge.alerts import count_new_alerts
+from fridge.queries import EXPIRY_ALERT_DAYS, get_dashboard_summary
+
+def render():
+    new_alert_count = count_new_alerts()
+    
+    st.header("📌 서비스 개요")
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("프로젝트 컨셉")
+        st.info("""
+        - **식재료 관리**: 냉장고 속 재료를 한눈에 파악하고 관리합니다.
+        - **소비기한 알림**: 유통기한 임박 재료를 알려주어 낭비를 막습니다.
+        - **레시피 추천**: 남은 재료를 활용할 수 있는 요리를 추천합니다.
+        - **환경 보호**: 음식물 쓰레기를 줄이고 분리배출 꿀팁을 제공합니다.
+        """)
+        
+    with col2:
+        st.subheader("현재 상태 요약")
+        
+        # 트리거가 관리하는 요약 테이블에서 한 줄만 조회
+        summary = get_dashboard_summary()
+
+        a, b = st.columns(2)
+        c, d = st.columns(2)
+        a.metric("총 등록 식재료", f"{summary['ingredient_count']} 개")
+        b.metric(f"임박 식재료 ({EXPIRY_ALERT_DAYS}일 이내)", f"{summary['expiring_count']} 개")
+        c.metric("총 음식물 쓰레기", f"{summary['waste_total_g']} g")
+        d.metric("현재 내 포인트", f"{summary['points_total']} P")
+
+        if new_alert_count:
+            st.warning(f"🔔 새 소비기한 알림 {new_alert_count}건 · '소비기한 알림' 메뉴에서 확인하세요.")
@@ -0,0 +1,91 @@
+"""(1) 식재료 관리 (DB 연동)"""
+import streamlit as st
+import pandas as pd
+
+from fridge.queries import (
+    INVENTORY_PAGE_SIZE, get_categories, get_inventory_page, get_consumption_log, add_ingredient,
+)
+from views.common import write, bulk_actions
+
+def render():
+    st.header("🥕 식재료 등록 / 관리")
+    
+    left, right = st.columns([1, 2])
+    
+    with left:
+        st.subheader("새 식재료 등록")
+        with st.form("add_form", clear_on_submit=True):
+            name = st.text_input("식재료명")
+            kind = st.selectbox("종류", ["채소", "과일", "단백질", "유제품", "배달음식", "기타"])
+            qty = st.number_input("수량", 1, 100, 1)
+            expire = st.date_input("유통기한")
+            
+            # 추가 정보 (선택사항)
+            tip = st.text_input("보관 꿀팁 (선택)")
+            rule = st.text_input("분리배출 규칙 (선택)")
+            
+            submitted = st.form_submit_button("DB에 저장하기")
+            
+            if submitted:
+                if name:
+                    write(add_ingredient, name, kind, qty, expire, tip, rule)
+                    st.success(f"✅ {name} 저장 완료!")
+                    st.rerun() # 새로고침해서 목록 갱신
+                else:
+                    st.warning("이름을 입력해주세요.")
+
+    with right:
+        st.subheader("📦 냉장고 목록 (DB 조회)")
+        
+        # 종류/이름 필터 (바뀌면 첫 페이지부터)
+        f1, f2 = st.columns(2)
+        category = f1.selectbox("종류 필터", ["전체"] + get_categories())
+        keyword = f2.text_input("이름 검색").strip()
+        filters = (category, keyword)
+        if st.session_state.get("inventory_filters") != filters:
+            st.session_state["inventory_filters"] = filters
+            st.session_state["inventory_cursors"] = [None]
+        cursors = st.session_state["inventory_cursors"]
+        
+        # 현재 페이지만 DB에서 불러오기 (소비기한 순)
+        df = get_inventory_page(cursors[-1], None if category == "전체" else category, keyword)
+        has_next = len(df) > INVENTORY_PAGE_SIZE
+        df = df.head(INVENTORY_PAGE_SIZE)
+        
+        # 데이터프레임 보여주기 (삭제 기능 포함)
+        if not df.empty:
+            st.dataframe(
+                df, 
+                column_config={
+                    "id": "ID",
+                    "name": "재료명",
+                    "expiry_date": "유통기한",
+                    "storage_type": "보관",
+                    "storage_tip": "💡 보관팁",
+                    "disposal_rule": "♻ 분리배출"
+                },
+                hide_index=True,
+                use_container_width=True
+            )
+            
+            prev_col, page_col, next_col = st.columns([1, 2, 1])
+            if prev_col.button("◀ 이전", disabled=len(cursors) == 1):
+                cursors.pop()
+                st.rerun()
+            page_col.caption(f"{len(cursors)} 페이지")
+            if next_col.button("다음 ▶", disabled=not has_next):
+                last = df.iloc[-1]
+                expiry = last['expiry_date'] if pd.notna(last['expiry_date']) else None
+                cursors.append((expiry, int(last['id'])))
+                st.rerun()
+            
+            # 일괄 처리 (지금 보고 있는 페이지의 재료 중에서 선택, 입력해서 찾기 가능)
+            with st.expander("🧺 여러 재료 한 번에 처리하기"):
+                bulk_actions(df, "inventory")
+            with st.expander("🍽 최근 먹은 기록"):
+                st.dataframe(get_consumption_log(), hide_index=True, use_container_width=True,
+                             column_config={"consumed_at": "시간", "name": "재료명", "amount": "먹은 수량", "remaining": "남은 수량"})
+        elif category != "전체" or keyword:
+            st.info("조건에 맞는 재료가 없습니다.")
+        else:
+            st.info("냉장고가 비어있습니다. 왼쪽에서 재료를 추가해주세요.")
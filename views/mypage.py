@@ -0,0 +1,68 @@
+"""(6) 마이페이지 (DB 포인트 연동)"""
+import streamlit as st
+
+from fridge.queries import POINTS_PER_LEVEL, HISTORY_PAGE_SIZE, award_points, get_point_balance, get_points_history
+from views.common import write
+
+def render():
+    st.header("⭐ 나의 에코 포인트")
+    
+    # 잔액은 요약 테이블에서, 레벨은 잔액에서 바로 계산
+    total_point = get_point_balance()
+    
+    # 레벨 계산 (0점으로 시작하므로 0~99점은 Lv.1)
+    level = total_point // POINTS_PER_LEVEL + 1
+    remain = POINTS_PER_LEVEL - (total_point % POINTS_PER_LEVEL)
+    
+    col1, col2 = st.columns([1, 2])
+    
+    with col1:
+        st.metric("현재 총 포인트", f"{total_point} P")
+        st.metric("내 레벨", f"Lv. {level}")
+        st.write(f"다음 레벨까지 **{remain} P** 남음")
+        st.progress((total_point % POINTS_PER_LEVEL) / POINTS_PER_LEVEL)
+        
+    with col2:
+        st.subheader("📝 포인트 적립 내역")
+        
+        # 페이지마다 시작 커서를 쌓아둠 (첫 페이지는 None)
+        if "points_cursors" not in st.session_state:
+            st.session_state["points_cursors"] = [None]
+        cursors = st.session_state["points_cursors"]
+        
+        point_df = get_points_history(cursors[-1])
+        has_next = len(point_df) > HISTORY_PAGE_SIZE
+        point_df = point_df.head(HISTORY_PAGE_SIZE)
+        
+        if not point_df.empty:
+            st.dataframe(
+                point_df[['action_date', 'description', 'points', 'balance_after']], 
+                hide_index=True,  # 인덱스(0,1,2) 숨기기
+                use_container_width=True,
+                column_config={
+                    "action_date": "날짜/시간",
+                    "description": "내역",
+                    "points": "포인트",
+                    "balance_after": "잔액"
+                }
+            )
+            
+            prev_col, page_col, next_col = st.columns([1, 2, 1])
+            if prev_col.button("◀ 이전", disabled=len(cursors) == 1):
+                cursors.pop()
+                st.rerun()
+            page_col.caption(f"{len(cursors)} 페이지")
+            if next_col.button("다음 ▶", disabled=not has_next):
+                last = point_df.iloc[-1]
+                cursors.append((last['action_date'], int(last['id'])))
+                st.rerun()
+        else:
+            st.info("아직 활동 내역이 없습니다.")
+            
+    # ▼ [수정됨] 버튼 이름과 기능 변경
+    if st.button("출석체크 (+10P)"):
+        # 하루에 한 번만 가능한 로직을 넣을 수도 있지만, 일단 기능 구현 위주로
+        write(award_points, "출석체크", 10)
+        st.session_state["points_cursors"] = [None]  # 새 내역이 보이도록 첫 페이지로
+        st.toast("출석체크 완료! 10포인트가 적립되었습니다.") # 알림 메시지도 예쁘게
+        st.rerun()
@@ -0,0 +1,43 @@
+"""(3) 레시피 추천 (DB 식재료 연동)"""
+import streamlit as st
+
+from fridge.queries import get_fridge_names
+from fridge.recipes import recommend_recipes, load_recipes
+
+def render():
+    st.header("🍳 레시피 추천")
+    
+    # DB에 있는 재료 목록 가져오기
+    my_ingredients = get_fridge_names()
+    
+    if not my_ingredients:
+        st.warning("냉장고에 재료가 없어요! 먼저 재료를 등록해주세요.")
+    else:
+        selected = st.multiselect("냉장고 속 재료 선택 (비워두면 냉장고 전체 기준)", my_ingredients)
+        
+        # DB에서 재료 색인으로 조인 + 집계 (충족률 순 정렬)
+        result = recommend_recipes(selected)
+        
+        if selected:
+            st.write(f"🔍 **{', '.join(selected)}** (으)로 만들 수 있는 요리:")
+        else:
+            st.write("🔍 지금 냉장고 속 재료로 만들 수 있는 요리:")
+        st.dataframe(
+            result,
+            column_config={
+                "일치율": st.column_config.ProgressColumn("일치율", format="%d%%", min_value=0, max_value=100)
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+        
+        if not result.empty:
+            st.bar_chart(result.set_index("레시피")["칼로리"])
+        else:
+            st.info("만들 수 있는 레시피가 없어요. 재료를 더 선택해 보세요.")
+
+    with st.expander("📥 레시피 파일 불러오기 (CSV)"):
+        recipe_file = st.file_uploader("레시피, 필요재료, 유형, 칼로리 컬럼이 있는 CSV", type="csv")
+        if recipe_file is not None and st.button("레시피 불러오기"):
+            n = load_recipes(recipe_file)
+            st.success(f"✅ 레시피 {n}개를 불러왔습니다.")
@@ -0,0 +1,54 @@
+"""(4) 음식물 쓰레기 분석 (DB 연동)"""
+import datetime
+
+import streamlit as st
+
+from fridge.queries import (
+    get_dashboard_summary, get_history_summary, get_first_waste_day, get_waste_series, log_waste,
+)
+from views.common import write
+
+def render():
+    st.header("🗑 음식물 쓰레기 로그")
+    
+    first_day = get_first_waste_day()
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        if first_day:
+            today = datetime.date.today()
+            period = st.date_input("조회 기간", (min(first_day, today), today))
+            
+            if len(period) == 2:
+                # 기간이 길면 주/월 단위로 묶어서 점 개수 제한
+                grain, series = get_waste_series(*period)
+                grain_label = {"day": "일별", "week": "주별", "month": "월별"}[grain]
+                st.caption(f"{grain_label} 합계")
+                st.line_chart(series.set_index("bucket")["total_g"])
+                
+                # 분석 멘트
+                st.write(f"📝 선택한 기간 배출량: **{int(series['total_g'].sum())} g**")
+            st.write(f"📝 지금까지 총 배출량: **{get_dashboard_summary()['waste_total_g']} g**")
+        else:
+            st.info("아직 버려진 음식물 기록이 없습니다. (좋은 소식이네요!)")
+        
+        # 재고에서 빠진 재료들이 어떻게 처리됐는지 (이력 테이블)
+        history = dict(get_history_summary().itertuples(index=False, name=None))
+        if history:
+            st.subheader("🧾 재료 처리 이력")
+            h1, h2, h3, h4 = st.columns(4)
+            h1.metric("다 먹음", f"{history.get('eaten', 0)} 개")
+            h2.metric("버림", f"{history.get('discarded', 0)} 개")
+            h3.metric("기한 지나 정리", f"{history.get('expired', 0)} 개")
+            h4.metric("삭제", f"{history.get('deleted', 0)} 개")
+            
+    with col2:
+        st.subheader("기록 추가")
+        d = st.date_input("날짜", datetime.date.today())
+        amt = st.number_input("배출량(g)", 100, 2000, 300)
+        
+        if st.button("기록 저장"):
+            write(log_waste, [(d, amt)])
+            st.success("저장되었습니다.")
+            st.rerun()